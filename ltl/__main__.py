@@ -12,8 +12,10 @@ import warnings
 # Suppress pydantic v1 incompatibility warning on Python 3.14+
 warnings.filterwarnings("ignore", message="Core Pydantic V1 functionality", category=UserWarning)
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Installed (`pip install -e .`) or run as `python -m ltl`, the package is
+# already importable; only a direct `python ltl/__main__.py` needs the repo root.
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ltl.commands import init, status, chat, cron, tool, gateway, setup, tui, voice
 import ltl.commands.config_wizard as config_wizard
@@ -6,7 +6,7 @@ Provides unified interface for different chat platforms.
 import asyncio
 import threading
 from abc import ABC, abstractmethod
-from typing import Optional, Callable
+from typing import AsyncIterator, Optional, Callable
 
 from ltl.core.bus import MessageBus, InboundMessage, OutboundMessage
 
@@ -21,8 +21,8 @@ class Channel(ABC):
         self.thread = None
 
     @abstractmethod
-    def start(self):
-        """Start the channel."""
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start the channel, running its I/O on loop if given (else its own thread)."""
         pass
 
     @abstractmethod
@@ -35,6 +35,11 @@ class Channel(ABC):
         """Send a message to a chat."""
         pass
 
+    async def stream_message(self, chat_id: str, chunks: AsyncIterator[str]):
+        """Deliver a reply that arrives in pieces. The default sends it once complete."""
+        content = "".join([chunk async for chunk in chunks])
+        await asyncio.to_thread(self.send_message, chat_id, content)
+
     def is_running(self) -> bool:
         """Check if channel is running."""
         return self.running
@@ -55,11 +60,11 @@ class ChannelManager:
         """Get a channel by name."""
         return self.channels.get(name)
 
-    def start_all(self):
-        """Start all registered channels."""
+    def start_all(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start all registered channels, sharing loop when one is given."""
         for channel in self.channels.values():
             try:
-                channel.start()
+                channel.start(loop)
                 print(f"✓ Started channel: {channel.name}")
             except Exception as e:
                 print(f"✗ Failed to start channel {channel.name}: {e}")
@@ -3,14 +3,10 @@
 Uses discord.py library (open source, free).
 """
 
-import os
-import sys
 import threading
 import asyncio
 from typing import List, Optional
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from ltl.channels import Channel
 from ltl.core.bus import MessageBus, InboundMessage, OutboundMessage
 
@@ -25,8 +21,8 @@ class DiscordChannel(Channel):
         self.client = None
         self.loop = None
 
-    def start(self):
-        """Start the Discord bot."""
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start the Discord bot, on loop if given, else on its own thread."""
         try:
             import discord
         except ImportError:
@@ -52,10 +48,12 @@ class DiscordChannel(Channel):
         async def on_message(message):
             await self._handle_message(message)
 
-        # Start bot in a separate thread
         self.running = True
-        self.thread = threading.Thread(target=self._run_bot, daemon=True)
-        self.thread.start()
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self.run(), loop)
+        else:
+            self.thread = threading.Thread(target=asyncio.run, args=(self.run(),), daemon=True)
+            self.thread.start()
 
         print(f"✅ Discord bot starting (token: {self.token[:10]}...)")
 
@@ -64,18 +62,16 @@ class DiscordChannel(Channel):
         self.running = False
         if self.client and self.loop:
             try:
-                # Stop the event loop
-                self.loop.call_soon_threadsafe(self.loop.stop)
+                asyncio.run_coroutine_threadsafe(self.client.close(), self.loop).result(timeout=5)
                 print("✅ Discord bot stopped")
             except Exception as e:
                 print(f"⚠️ Error stopping Discord bot: {e}")
 
-    def _run_bot(self):
-        """Run the Discord bot."""
+    async def run(self):
+        """Run the Discord client on the running loop until it is closed."""
+        self.loop = asyncio.get_running_loop()
         try:
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-            self.loop.run_until_complete(self.client.start(self.token))
+            await self.client.start(self.token)
         except Exception as e:
             print(f"❌ Discord bot error: {e}")
             self.running = False
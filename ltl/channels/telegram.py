@@ -8,13 +8,10 @@ import asyncio
 import base64
 import logging
 import os
-import sys
 import threading
 import time
 from io import BytesIO
-from typing import List, Optional
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from typing import AsyncIterator, List, Optional
 
 from ltl.channels import Channel
 from ltl.core.bus import MessageBus, InboundMessage, OutboundMessage
@@ -25,6 +22,7 @@ _RATE_LIMIT_MESSAGES = 20
 _RATE_LIMIT_WINDOW = 60       # seconds
 _MAX_MESSAGE_LENGTH = 4000    # Telegram cap is 4096; leave headroom
 _OLLAMA_URL = "http://localhost:11434"
+_STREAM_EDIT_INTERVAL = 1.0   # seconds between edits of a streamed reply
 
 
 class TelegramChannel(Channel):
@@ -37,10 +35,11 @@ class TelegramChannel(Channel):
         self.allowed_users = allowed_users or []
         self.application = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._future = None  # run() scheduled on a shared loop
         self._rate_timestamps: dict[str, list[float]] = {}
         self._rate_lock = threading.Lock()
         self._config = config or {}
-        self._rlm_holder = rlm_holder  # {"client": RLMClient} — updated on /model switch
+        self._rlm_holder = rlm_holder  # {"client": RLMClient, "clients": ClientCache} — updated on /model switch
 
         if not self.allowed_users:
             log.warning(
@@ -52,8 +51,8 @@ class TelegramChannel(Channel):
     # Lifecycle
     # ------------------------------------------------------------------
 
-    def start(self):
-        """Start the Telegram bot."""
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start the Telegram bot, polling on loop if given, else on its own thread."""
         try:
             from telegram import Update
             from telegram.ext import Application, CommandHandler, MessageHandler, filters
@@ -86,36 +85,44 @@ class TelegramChannel(Channel):
         self.bus.register_channel_handler("telegram", self._deliver_outbound)
 
         self.running = True
-        self.thread = threading.Thread(target=self._run_polling, daemon=True)
-        self.thread.start()
+        if loop is not None:
+            self._future = asyncio.run_coroutine_threadsafe(self.run(), loop)
+        else:
+            self.thread = threading.Thread(target=asyncio.run, args=(self.run(),), daemon=True)
+            self.thread.start()
 
         log.info("Telegram bot started")
         print("✅ Telegram bot started")
 
     def stop(self):
         self.running = False
+        if self._future is not None:
+            try:
+                self._future.result(timeout=5)  # let polling shut down cleanly
+            except Exception:
+                pass
+            self._future = None
         log.info("Telegram bot stopped")
         print("✅ Telegram bot stopped")
 
-    def _run_polling(self):
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
+    async def run(self):
+        """Poll for updates on the running loop until stop() is called."""
+        self._loop = asyncio.get_running_loop()
         retry = 0
         while self.running:
             try:
-                self._loop.run_until_complete(self._async_polling())
+                await self._async_polling()
                 break  # clean exit
             except Exception as e:
                 if "Conflict" in str(e):
                     wait = min(30, 5 * (retry + 1))
                     log.warning("Telegram conflict — another instance may be running. Retrying in %ds...", wait)
-                    time.sleep(wait)
+                    await asyncio.sleep(wait)
                     retry += 1
                 else:
                     log.error("Telegram polling error: %s", e)
                     self.running = False
                     break
-        self._loop.close()
         self._loop = None
 
     async def _async_polling(self):
@@ -158,20 +165,54 @@ class TelegramChannel(Channel):
         except Exception as e:
             log.error("Failed to send message to %s: %s", chat_id, e)
 
-    def _send_photo(self, chat_id: str, photo_bytes: bytes, caption: str = ""):
-        if not self.application or not self._loop:
-            return
+    async def stream_message(self, chat_id: str, chunks: AsyncIterator[str]):
+        """Post the reply as soon as it starts, then edit it in place as it grows.
 
-        async def _send():
-            await self.application.bot.send_photo(
-                chat_id=chat_id, photo=photo_bytes, caption=caption
-            )
+        Text past _MAX_MESSAGE_LENGTH continues in a new message. Throttled
+        in-between edits that Telegram refuses (RetryAfter, BadRequest) are
+        skipped; only posting the finished text can fail the reply, and chunks
+        is read to the end either way so the reply still gets cached.
+        """
+        if not self.application or self._loop is not asyncio.get_running_loop():
+            return await super().stream_message(chat_id, chunks)
 
+        from telegram.error import TelegramError
+
+        text = shown = ""
+        message = None
+        last_edit = 0.0
         try:
-            future = asyncio.run_coroutine_threadsafe(_send(), self._loop)
-            future.result(timeout=20)
-        except Exception as e:
-            log.error("Failed to send photo to %s: %s", chat_id, e)
+            async for chunk in chunks:
+                text += chunk
+                while len(text) > _MAX_MESSAGE_LENGTH:
+                    # Finish this message at the last line break that fits
+                    cut = text.rfind("\n", 0, _MAX_MESSAGE_LENGTH) + 1 or _MAX_MESSAGE_LENGTH
+                    await self._post_or_edit(chat_id, message, text[:cut])
+                    text, shown, message = text[cut:], "", None
+                if not text.strip():
+                    continue
+                now = time.monotonic()
+                if message is not None and now - last_edit < _STREAM_EDIT_INTERVAL:
+                    continue
+                try:
+                    message = await self._post_or_edit(chat_id, message, text)
+                except TelegramError as e:
+                    log.debug("Skipped streamed edit for %s: %s", chat_id, e)
+                    continue
+                shown, last_edit = text, now
+        except Exception:
+            async for _ in chunks:
+                pass
+            raise
+        if text.strip() and text != shown:
+            await self._post_or_edit(chat_id, message, text)
+
+    async def _post_or_edit(self, chat_id: str, message, text: str):
+        """Send text as a new message, or replace message's text with it; returns the message."""
+        if message is None:
+            return await self.application.bot.send_message(chat_id=chat_id, text=text)
+        await message.edit_text(text)
+        return message
 
     # ------------------------------------------------------------------
     # Security helpers
@@ -246,8 +287,8 @@ class TelegramChannel(Channel):
             await update.message.reply_text("❌ Camera unavailable or capture failed.")
             return
 
-        # Send the photo
-        self._send_photo(chat_id, image_bytes, caption="📸 Captured")
+        # Send the photo (we're on the bot's loop, so await it directly)
+        await context.bot.send_photo(chat_id=chat_id, photo=image_bytes, caption="📸 Captured")
 
         # Describe with vision model
         await context.bot.send_chat_action(chat_id=chat_id, action="typing")
@@ -388,9 +429,8 @@ class TelegramChannel(Channel):
         return "\n".join(lines)
 
     def _switch_model(self, model_name: str) -> str:
-        import json
         import requests
-        from ltl.core.config import CONFIG_PATH, load_config, save_config, get_default_config
+        from ltl.core.config import load_config, load_raw_config, save_config
 
         is_openrouter = "/" in model_name
 
@@ -400,11 +440,7 @@ class TelegramChannel(Channel):
             if not or_key:
                 return "❌ OpenRouter API key not set. Add OPENROUTER_API_KEY to ~/.ltl/.env"
 
-            if os.path.exists(CONFIG_PATH):
-                with open(CONFIG_PATH) as f:
-                    raw = json.load(f)
-            else:
-                raw = get_default_config()
+            raw = load_raw_config()
             raw["backend"] = "openrouter"
             raw.setdefault("providers", {}).setdefault("openrouter", {})["text_model"] = model_name
             save_config(raw)
@@ -428,11 +464,7 @@ class TelegramChannel(Channel):
             except Exception:
                 pass  # Ollama offline — save anyway
 
-            if os.path.exists(CONFIG_PATH):
-                with open(CONFIG_PATH) as f:
-                    raw = json.load(f)
-            else:
-                raw = get_default_config()
+            raw = load_raw_config()
             raw["backend"] = "ollama"
             raw.setdefault("providers", {}).setdefault("ollama", {})["text_model"] = model_name
             save_config(raw)
@@ -442,8 +474,14 @@ class TelegramChannel(Channel):
         # Hot-swap the running RLM client
         if self._rlm_holder is not None:
             try:
-                from src.rlm_client import RLMClient
-                self._rlm_holder["client"] = RLMClient(self._config)
+                clients = self._rlm_holder.get("clients")
+                if clients is not None:
+                    self._rlm_holder["client"] = clients.get(self._config)
+                else:
+                    from src.rlm_client import RLMClient
+                    self._rlm_holder["client"] = RLMClient(self._config)
+                # Invalidates the gateway's cached replies from the old model
+                self._rlm_holder["generation"] = self._rlm_holder.get("generation", 0) + 1
             except Exception as e:
                 return f"✅ Switched to {model_name} (saved), but live reload failed: {e}"
 
@@ -555,9 +593,8 @@ class TelegramChannel(Channel):
 
     def _do_memory_search(self, query: str) -> str:
         try:
-            from src.database import DatabaseManager
-            db = DatabaseManager("~/.local/share/talking-llm/assistant.db")
-            db.init_db()
+            from src.database import get_db
+            db = get_db()
             results = db.semantic_search_memories(query, limit=5)
             if not results:
                 return f"No memories found for: {query}"
@@ -600,7 +637,6 @@ class TelegramChannel(Channel):
             chat_id=chat_id,
             content=message_text,
             session_key=f"telegram:{chat_id}",
-            timestamp=time.time(),
             metadata={"username": user.username},
         ))
         await context.bot.send_chat_action(chat_id=chat_id, action="typing")
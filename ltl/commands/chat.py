@@ -1,31 +1,18 @@
 """Chat command - Text-based chat with the assistant."""
 
-import os
 import re
 import sys
-from typing import Optional
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
-# Try to import langchain, fallback to simple implementation
-try:
-    from langchain_core.chat_history import InMemoryChatMessageHistory
-    from langchain_core.messages import HumanMessage, AIMessage
-    from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-    from langchain_core.runnables.history import RunnableWithMessageHistory
-    from langchain_ollama import OllamaLLM
-    from src.persistent_history import PersistentHistory, make_session_id
-    from src.rlm_client import RLMClient
-
-    LANGCHAIN_AVAILABLE = True
-except ImportError:
-    LANGCHAIN_AVAILABLE = False
-
-try:
-    from src.web_search import WebSearch
-    SEARCH_AVAILABLE = True
-except ImportError:
-    SEARCH_AVAILABLE = False
+import time
+from importlib.util import find_spec
+from typing import Callable, Optional
+
+import orjson
+
+# Probe optional backends without importing them; langchain (and the rlm/ddgs
+# stacks) are only imported once a chat actually starts, so other commands and
+# `ltl --help` don't pay for them. Falls back to the direct Ollama API.
+LANGCHAIN_AVAILABLE = all(find_spec(m) for m in ("langchain_core", "langchain_ollama", "rlm"))
+SEARCH_AVAILABLE = find_spec("ddgs") is not None
 
 # Phrases that signal a web-search intent
 _SEARCH_RE = re.compile(
@@ -34,6 +21,56 @@ _SEARCH_RE = re.compile(
     re.IGNORECASE,
 )
 
+_DIRECT_SYSTEM_PROMPT = "You are LTL, a helpful AI assistant. Be concise, accurate, and friendly."
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Streamed-token flush thresholds (overridable via config["chat"]["stream"])
+_STREAM_MIN_BATCH = 8
+_STREAM_FLUSH_INTERVAL = 0.02  # seconds
+
+
+class ChatCancelled(Exception):
+    """Raised by an ``on_token`` callback to abandon the reply being generated."""
+
+
+class TokenPrinter:
+    """Write streamed tokens to stdout in small batches.
+
+    The first token is flushed immediately so time-to-first-token is not
+    delayed; after that tokens are buffered until ``min_batch`` have arrived
+    or ``flush_interval`` seconds have passed since the last flush.
+    """
+
+    def __init__(self, min_batch: int = _STREAM_MIN_BATCH, flush_interval: float = _STREAM_FLUSH_INTERVAL):
+        self.min_batch = min_batch
+        self.flush_interval = flush_interval
+        self._buf: list[str] = []
+        self._first = True
+        self._last_flush = time.monotonic()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "TokenPrinter":
+        stream_cfg = config.get("chat", {}).get("stream", {})
+        return cls(
+            min_batch=stream_cfg.get("min_batch", _STREAM_MIN_BATCH),
+            flush_interval=stream_cfg.get("flush_interval", _STREAM_FLUSH_INTERVAL),
+        )
+
+    def __call__(self, token: str):
+        self._buf.append(token)
+        now = time.monotonic()
+        if self._first or len(self._buf) >= self.min_batch or now - self._last_flush >= self.flush_interval:
+            self._first = False
+            self._last_flush = now
+            self.flush()
+
+    def flush(self):
+        """Write out whatever is buffered."""
+        if self._buf:
+            sys.stdout.write("".join(self._buf))
+            sys.stdout.flush()
+            self._buf.clear()
+
 
 class TextChatAssistant:
     """Text-based chat assistant using Ollama."""
@@ -50,6 +87,12 @@ class TextChatAssistant:
         self.temperature = config.get("agents", {}).get("defaults", {}).get("temperature", 0.7)
 
         if LANGCHAIN_AVAILABLE:
+            from langchain_core.chat_history import InMemoryChatMessageHistory
+            from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+            from langchain_ollama import OllamaLLM
+            from src.persistent_history import PersistentHistory, make_session_id
+            from src.rlm_client import RLMClient
+
             # Use persistent history (falls back to in-memory on failure)
             hist_cfg = config.get("history", {})
             ollama_cfg = config.get("providers", {}).get("ollama", {})
@@ -80,20 +123,24 @@ class TextChatAssistant:
                 ]
             )
 
-            self.chain = RunnableWithMessageHistory(
-                prompt | self.llm,
-                lambda session_id: self.chat_history,
-                input_messages_key="input",
-                history_messages_key="history",
-            )
+            # History is passed in and recorded by _chat_langchain, after the
+            # reply has been handed over, so an abandoned reply isn't kept
+            self.chain = prompt | self.llm
             try:
                 self._rlm = RLMClient(config)
             except Exception:
                 self._rlm = None
         else:
             # Fallback to direct Ollama API calls
+            import requests
+
             self.use_direct_api = True
             self._rlm = None
+            self.session = requests.Session()
+            # Static parts of the request body, built once instead of per turn
+            self._chat_url = f"{self.base_url}/api/chat"
+            self._system_msg = {"role": "system", "content": _DIRECT_SYSTEM_PROMPT}
+            self._opts = {"temperature": self.temperature, "num_predict": 512}
 
     def _maybe_inject_search(self, message: str) -> str:
         """If message looks like a search query, prepend web results and return enriched prompt."""
@@ -108,42 +155,58 @@ class TextChatAssistant:
             f"[Web search results for context:]\n{results}"
         )
 
-    def chat(self, message: str) -> str:
-        """Send a message and get response."""
+    def chat(self, message: str, on_token: Optional[Callable[[str], None]] = None) -> str:
+        """Send a message and get response.
+
+        ``on_token`` receives the reply as it is produced: token by token on the
+        streaming direct-API path, or as a single piece otherwise. It may raise
+        ChatCancelled to stop generation; the exchange is then not recorded.
+        """
         enriched = self._maybe_inject_search(message)
-        if LANGCHAIN_AVAILABLE:
-            if self._rlm:
-                try:
-                    response = self._rlm.get_response(enriched, self.chat_history.messages)
-                    self.chat_history.add_message(HumanMessage(content=message))
-                    self.chat_history.add_message(AIMessage(content=response))
-                    return response
-                except Exception as e:
-                    import logging
-                    logging.getLogger(__name__).warning("RLM failed (%s), falling back to LangChain", e)
-            try:
-                response = self.chain.invoke(
-                    {"input": enriched}, config={"configurable": {"session_id": "ltl-cli-chat"}}
-                )
-                return str(response)
-            except Exception as e:
-                return f"Sorry, I encountered an error: {e}"
-        else:
+        if not LANGCHAIN_AVAILABLE:
             # Direct API fallback
-            return self._chat_direct(enriched)
+            return self._chat_direct(enriched, on_token)
 
-    def _chat_direct(self, message: str) -> str:
-        """Direct Ollama API chat without langchain."""
-        try:
-            import requests
+        return self._chat_langchain(message, enriched, on_token)
+
+    @staticmethod
+    def _emit(reply: str, on_token: Optional[Callable[[str], None]]) -> str:
+        """Hand a non-streamed reply to ``on_token`` in one piece and return it."""
+        if on_token:
+            on_token(reply)
+        return reply
+
+    def _chat_langchain(
+        self, message: str, enriched: str, on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """Chat via RLM, falling back to the LangChain chain."""
+        from langchain_core.messages import HumanMessage, AIMessage
 
+        if self._rlm:
+            try:
+                response = self._rlm.get_response(enriched, self.chat_history.messages)
+            except Exception as e:
+                import logging
+                logging.getLogger(__name__).warning("RLM failed (%s), falling back to LangChain", e)
+            else:
+                self._emit(response, on_token)
+                self.chat_history.add_message(HumanMessage(content=message))
+                self.chat_history.add_message(AIMessage(content=response))
+                return response
+        try:
+            response = str(self.chain.invoke({"input": enriched, "history": self.chat_history.messages}))
+        except Exception as e:
+            return self._emit(f"Sorry, I encountered an error: {e}", on_token)
+        self._emit(response, on_token)
+        self.chat_history.add_message(HumanMessage(content=enriched))
+        self.chat_history.add_message(AIMessage(content=response))
+        return response
+
+    def _chat_direct(self, message: str, on_token: Optional[Callable[[str], None]] = None) -> str:
+        """Direct Ollama API chat without langchain, streamed as NDJSON."""
+        try:
             # Build conversation history
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are LTL, a helpful AI assistant. Be concise, accurate, and friendly.",
-                }
-            ]
+            messages = [self._system_msg]
 
             # Add recent history (last 4 messages to keep context manageable)
             for msg in self.chat_history[-4:]:
@@ -155,27 +218,33 @@ class TextChatAssistant:
             # Add current message
             messages.append({"role": "user", "content": message})
 
-            # Call Ollama API
-            response = requests.post(
-                f"{self.base_url}/api/chat",
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "stream": False,
-                    "options": {"temperature": self.temperature, "num_predict": 512},
-                },
-                timeout=30,
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                ai_response = result["message"]["content"]
-                return ai_response
-            else:
-                return f"API error: {response.status_code}"
-
+            # Call Ollama API (orjson returns bytes, so requests sends the body as-is)
+            body = orjson.dumps({"model": self.model, "messages": messages, "stream": True, "options": self._opts})
+            with self.session.post(
+                self._chat_url, data=body, headers=_JSON_HEADERS, timeout=30, stream=True
+            ) as response:
+                if response.status_code != 200:
+                    return self._emit(f"API error: {response.status_code}", on_token)
+
+                parts = []
+                for line in response.iter_lines():
+                    try:
+                        chunk = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue  # keep-alive blank line
+                    delta = chunk.get("message", {}).get("content", "")
+                    if delta:
+                        parts.append(delta)
+                        if on_token:
+                            on_token(delta)
+                    if chunk.get("done"):
+                        break
+                return "".join(parts)
+
+        except ChatCancelled:
+            raise
         except Exception as e:
-            return f"Sorry, I encountered an error: {e}"
+            return self._emit(f"Sorry, I encountered an error: {e}", on_token)
 
 
 def run(args):
@@ -211,6 +280,8 @@ def run(args):
     no_search = getattr(args, "no_search", False)
     if SEARCH_AVAILABLE and not no_search:
         try:
+            from src.web_search import WebSearch
+
             search_engine = WebSearch(config.get("search", {}))
             print("🔍 DuckDuckGo search enabled")
         except Exception as e:
@@ -227,8 +298,10 @@ def run(args):
         # Single message mode
         print(f"🎙️  You: {args.message}")
         print("🤖 Assistant: ", end="", flush=True)
-        response = assistant.chat(args.message)
-        print(response)
+        printer = TokenPrinter.from_config(config)
+        assistant.chat(args.message, on_token=printer)
+        printer.flush()
+        print()
     else:
         # Interactive mode
         print("🎙️  LTL Text Chat Mode")
@@ -255,9 +328,10 @@ def run(args):
                     continue
 
                 print("🤖 Assistant: ", end="", flush=True)
-                response = assistant.chat(user_input)
-                print(response)
-                print()
+                printer = TokenPrinter.from_config(config)
+                assistant.chat(user_input, on_token=printer)
+                printer.flush()
+                print("\n")
 
             except KeyboardInterrupt:
                 print("\n\n👋 Goodbye!")
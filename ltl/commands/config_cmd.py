@@ -1,10 +1,8 @@
 """Config command - Manage configuration."""
 
 import os
-import json
-import sys
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import orjson
 
 from ltl.core.config import load_config, get_config_path
 
@@ -23,10 +21,10 @@ def show(args):
     print("=" * 60)
 
     try:
-        with open(config_path, "r") as f:
-            config = json.load(f)
+        with open(config_path, "rb") as f:
+            config = orjson.loads(f.read())
 
-        print(json.dumps(config, indent=2))
+        print(orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode())
     except Exception as e:
         print(f"Error reading config: {e}")
 
@@ -1,13 +1,11 @@
 """Enhanced config command with interactive wizard and CLI configuration."""
 
 import os
-import sys
 import argparse
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from ltl.core.wizard import (
     ConfigWizard,
+    format_setting,
     set_provider,
     set_channel,
     show_config,
@@ -32,14 +30,8 @@ def run(args):
             show_config()
 
         elif args.config_command == "set":
-            # Set a specific value
-            if not args.key:
-                print_error("Missing --key argument")
-                print_info("Usage: ltl config set --key <path> --value <value>")
-                return
-
-            wizard = ConfigWizard()
-            wizard.configure_single_setting(args.key, args.value)
+            # Set one or more values, saved together
+            configure_settings_cli(args)
 
         elif args.config_command == "provider":
             # Configure a provider
@@ -61,6 +53,31 @@ def run(args):
         show_config()
 
 
+def configure_settings_cli(args):
+    """Apply key=value pairs (and/or --key/--value) with a single save."""
+    # The first pair is parsed into the shared `name` positional
+    pairs = [pair for pair in [args.name, *args.settings] if pair]
+    settings = []
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep or not key:
+            print_error(f"Expected key=value, got: {pair}")
+            return
+        settings.append((key, value))
+    if args.key:
+        settings.append((args.key, args.value))
+    if not settings:
+        print_error("Nothing to set")
+        print_info("Usage: ltl config set <path>=<value> [<path>=<value> ...]")
+        return
+
+    with ConfigWizard() as wizard:
+        for key, value in settings:
+            wizard.apply_setting(key, value)
+    for key, value in settings:
+        print_success(format_setting(key, value))
+
+
 def configure_provider_cli(args):
     """Configure provider via CLI arguments."""
     if not args.name:
@@ -137,9 +154,9 @@ Examples:
   ltl config show               Display current settings
   ltl config edit               Edit configuration file
   
-  # Set specific values
+  # Set specific values (several pairs are saved together)
+  ltl config set backend=openrouter providers.openrouter.text_model=openai/gpt-4o-mini
   ltl config set --key providers.openrouter.api_key --value "sk-..."
-  ltl config set --key backend --value "openrouter"
   
   # Configure providers
   ltl config provider openrouter --api-key "sk-..."
@@ -163,8 +180,9 @@ Examples:
     config_parser.add_argument("--key", "-k", help="Configuration key path (e.g., providers.openrouter.api_key)")
     config_parser.add_argument("--value", "-v", help="Value to set")
 
-    # For 'provider' command
+    # For 'provider' and 'channel' commands (and the first key=value of 'set')
     config_parser.add_argument("name", nargs="?", help="Provider name (openrouter, ollama, localai)")
+    config_parser.add_argument("settings", nargs="*", metavar="key=value", help="Settings for 'set'")
     config_parser.add_argument("--api-key", help="API key for the provider")
     config_parser.add_argument("--base-url", help="Base URL for the provider")
     config_parser.add_argument("--text-model", help="Text model name (for Ollama)")
@@ -1,9 +1,5 @@
 """Cron command - Manage scheduled tasks."""
 
-import os
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 
 def list_tasks(args):
@@ -4,54 +4,219 @@ Routes messages between channels and the assistant.
 Uses the full agent framework: Orchestrator intent routing → WebSearch / ToolExecutor / RLMClient.
 """
 
+import asyncio
 import logging
 import os
+import queue
+import re
+import signal
 import sys
-import time
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
+
+from ltl.core.bus import get_bus, OutboundMessage
+from ltl.core.cache import TTLCache
 
 log = logging.getLogger(__name__)
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Max inbound messages routed concurrently by process_messages
+_MAX_CONCURRENT_MESSAGES = 16
 
-from ltl.core.bus import get_bus, OutboundMessage
-from ltl.core.config import load_config
-from ltl.channels import get_manager
-from ltl.channels.telegram import create_telegram_channel
-from ltl.channels.discord import create_discord_channel
-from src.rlm_client import RLMClient
+# Replies for channels without a direct sender are handed to the bus in
+# batches of up to this many messages, or whatever arrived within the window.
+_OUTBOUND_BATCH_SIZE = 10
+_OUTBOUND_BATCH_WINDOW = 0.05
+
+# Repeated questions and searches are answered from memory. Reply keys include
+# rlm_holder["generation"], which /model bumps, so a model switch starts fresh.
+_reply_cache = TTLCache(maxsize=512, ttl=300)
+_search_cache = TTLCache(maxsize=256, ttl=3600)
+
+# Static instructions lead the search prompt so backends that reuse the KV
+# cache for a repeated prefix (Ollama, OpenAI-style prompt caching) only
+# process the question and snippets on each call.
+_SEARCH_PROMPT_PREFIX = "Answer the question in 1-3 sentences using the search results below.\n\n"
+
+# Cuts each "    Snippet: ..." line of search_and_format output to 200 chars
+_SNIPPET_RE = re.compile(r"^(    Snippet: .{0,200}).*$", re.MULTILINE)
+
+# Agent components are built once per distinct config and shared by the TUI
+# background gateway and `ltl gateway`, so the DB and models load only once.
+_components_cache: dict[bytes, dict] = {}
+_components_lock = threading.Lock()
+
+
+class ClientCache:
+    """Most recently used RLMClients, one per backend/model.
+
+    /model switches through this cache so going back to a recent model reuses
+    its client instead of building a new one. Evicted clients stay alive for
+    any request that still holds them.
+    """
+
+    def __init__(self, maxsize: int | None = None):
+        self.maxsize = maxsize or int(os.environ.get("LTL_MODEL_CACHE_SIZE", "4"))
+        self._clients: OrderedDict[tuple, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def model_key(cfg: dict) -> tuple:
+        """(backend, base_url, model) that RLMClient would pick for cfg."""
+        backend = cfg.get("backend", "ollama")
+        if backend in ("ollama", "auto"):
+            provider = cfg.get("ollama") or cfg.get("providers", {}).get("ollama", {})
+        else:
+            provider = cfg.get("openrouter") or cfg.get("providers", {}).get("openrouter", {})
+        return backend, provider.get("base_url"), provider.get("text_model")
+
+    def get(self, cfg: dict):
+        """Return the cached RLMClient for cfg's model, creating it on a miss."""
+        key = self.model_key(cfg)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+
+        from src.rlm_client import RLMClient
+
+        client = RLMClient(cfg)
+        with self._lock:
+            self._clients[key] = client
+            while len(self._clients) > self.maxsize:
+                self._clients.popitem(last=False)
+        return client
+
+
+def _stream_enabled(cfg: dict) -> bool:
+    """config["gateway"]["stream"]: stream chat replies into the channel as they generate.
+
+    Streamed replies come from a single completion, not RLM's recursive loop.
+    """
+    return bool(cfg.get("gateway", {}).get("stream", False))
 
 
 def _init_agent_components(cfg: dict) -> dict:
-    """Initialise Orchestrator, ToolExecutor, and WebSearch. Returns a components dict."""
-    components = {"orchestrator": None, "tool_executor": None, "web_search": None}
+    """Return the shared Orchestrator/ToolExecutor/WebSearch components for cfg."""
+    key = orjson.dumps(cfg, option=orjson.OPT_SORT_KEYS)
+    with _components_lock:
+        components = _components_cache.get(key)
+        if components is None:
+            components = _components_cache[key] = _build_agent_components(cfg)
+    return components
 
-    try:
-        from src.orchestrator import Orchestrator
-        components["orchestrator"] = Orchestrator(cfg)
-    except Exception as e:
-        log.warning("Orchestrator unavailable: %s", e)
 
-    try:
-        from src.web_search import WebSearch
-        components["web_search"] = WebSearch(cfg.get("tools", {}).get("web", {}).get("search", {}))
-    except Exception as e:
-        log.warning("WebSearch unavailable: %s", e)
+def _make_orchestrator(cfg: dict):
+    from src.orchestrator import Orchestrator
+
+    return Orchestrator(cfg)
+
+
+def _make_web_search(cfg: dict):
+    from src.web_search import WebSearch
+
+    return WebSearch(cfg.get("tools", {}).get("web", {}).get("search", {}))
+
+
+def _make_tool_executor(cfg: dict):
+    from src.database import get_db
+    from src.tools import ToolExecutor
+
+    return ToolExecutor(get_db(), cfg)
+
+
+_COMPONENT_FACTORIES = {
+    "orchestrator": (_make_orchestrator, "Orchestrator"),
+    "web_search": (_make_web_search, "WebSearch"),
+    "tool_executor": (_make_tool_executor, "ToolExecutor"),
+}
+
+
+def _build_agent_components(cfg: dict) -> dict:
+    """Initialise Orchestrator, ToolExecutor, WebSearch and the optional SemanticCache.
+
+    The three agent components are independent (imports, DB open), so they are
+    built on worker threads and startup costs the slowest one, not the sum.
+    """
+    from ltl.core.semantic_cache import SemanticCache
+
+    components = {}
+    with ThreadPoolExecutor(max_workers=len(_COMPONENT_FACTORIES)) as pool:
+        futures = {name: pool.submit(make, cfg) for name, (make, _) in _COMPONENT_FACTORIES.items()}
+        for name, future in futures.items():
+            try:
+                components[name] = future.result()
+            except Exception as e:
+                log.warning("%s unavailable: %s", _COMPONENT_FACTORIES[name][1], e)
+                components[name] = None
+
+    components["semantic_cache"] = SemanticCache.from_config(cfg)
+
+    return components
+
+
+def _normalize(text: str) -> str:
+    """Cache-key form of a prompt: lowercased with whitespace collapsed."""
+    return " ".join(text.lower().split())
+
+
+async def _cached_search(web_search, query: str, max_results: int) -> str:
+    """web_search.search_and_format, memoized for an hour (empty results are not cached)."""
+    key = (_normalize(query), max_results)
+    results = _search_cache.get(key)
+    if results is None:
+        results = await asyncio.to_thread(web_search.search_and_format, query, max_results=max_results)
+        if results != "No search results found.":
+            _search_cache.set(key, results)
+    else:
+        log.debug("Search cache hit (%d hits / %d misses)", _search_cache.hits, _search_cache.misses)
+    return results
+
+
+async def _cached_response(rlm_client, rlm_holder: dict, prompt: str) -> str:
+    """rlm_client.get_response, memoized per model generation."""
+    key = (rlm_holder.get("generation", 0), _normalize(prompt))
+    reply = _reply_cache.get(key)
+    if reply is None:
+        reply = await asyncio.to_thread(rlm_client.get_response, prompt)
+        _reply_cache.set(key, reply)
+    else:
+        log.debug("Reply cache hit (%d hits / %d misses)", _reply_cache.hits, _reply_cache.misses)
+    return reply
+
 
+async def _stream_response(rlm_client, rlm_holder: dict, prompt: str, semantic_cache=None) -> AsyncIterator[str]:
+    """Yield rlm_client's streamed reply, then cache the full text like _cached_response."""
+    parts = []
     try:
-        from src.database import DatabaseManager
-        from src.tools import ToolExecutor
-        db = DatabaseManager("~/.local/share/talking-llm/assistant.db")
-        db.init_db()
-        components["tool_executor"] = ToolExecutor(db, cfg)
+        async for delta in rlm_client.astream_response(prompt):
+            parts.append(delta)
+            yield delta
     except Exception as e:
-        log.warning("ToolExecutor unavailable: %s", e)
+        log.error("RLM stream error: %s", e)
+        if not parts:
+            yield "Sorry, I couldn't process that request. Please try again."
+        return
+
+    scope = rlm_holder.get("generation", 0)
+    reply = "".join(parts).strip()
+    _reply_cache.set((scope, _normalize(prompt)), reply)
+    if semantic_cache is not None:
+        await asyncio.to_thread(semantic_cache.insert, scope, prompt, reply)
 
-    return components
 
+async def _route_message(text: str, rlm_holder: dict, components: dict) -> str | AsyncIterator[str]:
+    """Route a message through the agent framework and return a response string.
 
-def _route_message(text: str, rlm_holder: dict, components: dict) -> str:
-    """Route a message through the agent framework and return a response string."""
+    Blocking component calls (HTTP search, LLM, tools) run in worker threads so
+    the gateway event loop can keep accepting messages. With rlm_holder["stream"]
+    set, uncached chat replies come back as an async iterator of text pieces.
+    """
     orchestrator = components.get("orchestrator")
     tool_executor = components.get("tool_executor")
     web_search = components.get("web_search")
@@ -60,7 +225,8 @@ def _route_message(text: str, rlm_holder: dict, components: dict) -> str:
     intent = {"intent": "chat"}
     if orchestrator:
         try:
-            intent = orchestrator.classify_intent(text)
+            intent = orchestrator.classify_intent(text, announce=False)
+            log.debug("Intent: %s (%s)", intent["intent"], intent["reasoning"])
         except Exception as e:
             log.warning("Orchestrator failed: %s", e)
 
@@ -69,33 +235,40 @@ def _route_message(text: str, rlm_holder: dict, components: dict) -> str:
     if intent_type == "search" and web_search:
         try:
             query = intent.get("search_query") or text
-            results = web_search.search_and_format(query, max_results=3)
+            results = await _cached_search(web_search, query, 3)
             if rlm_client and results != "No search results found.":
                 # Trim each snippet to 200 chars to keep the prompt short
-                trimmed = "\n\n".join(
-                    line if not line.startswith("    Snippet:") else
-                    "    Snippet: " + line[12:212]
-                    for line in results.splitlines()
-                )
-                prompt = (
-                    f"Q: {text}\n\nSearch results:\n{trimmed}\n\n"
-                    "Answer in 1-3 sentences:"
-                )
-                return rlm_client.get_response(prompt)
+                trimmed = _SNIPPET_RE.sub(r"\1", results)
+                prompt = f"{_SEARCH_PROMPT_PREFIX}Question: {text}\n\nSearch results:\n{trimmed}"
+                return await _cached_response(rlm_client, rlm_holder, prompt)
             return results
         except Exception as e:
             log.error("Search routing failed: %s", e)
 
     elif intent_type == "tool" and tool_executor:
         try:
-            return tool_executor.extract_and_execute(text)
+            return await asyncio.to_thread(tool_executor.extract_and_execute, text)
         except Exception as e:
             log.error("Tool routing failed: %s", e)
 
     # Default: plain chat via RLM
     if rlm_client:
         try:
-            return rlm_client.get_response(text)
+            semantic_cache = components.get("semantic_cache")
+            scope = rlm_holder.get("generation", 0)
+            if semantic_cache is not None:
+                reply = await asyncio.to_thread(semantic_cache.lookup, scope, text)
+                if reply is not None:
+                    return reply
+            if rlm_holder.get("stream"):
+                reply = _reply_cache.get((scope, _normalize(text)))
+                if reply is not None:
+                    return reply
+                return _stream_response(rlm_client, rlm_holder, text, semantic_cache)
+            reply = await _cached_response(rlm_client, rlm_holder, text)
+            if semantic_cache is not None:
+                await asyncio.to_thread(semantic_cache.insert, scope, text, reply)
+            return reply
         except Exception as e:
             log.error("RLM error: %s", e)
             return "Sorry, I couldn't process that request. Please try again."
@@ -103,13 +276,58 @@ def _route_message(text: str, rlm_holder: dict, components: dict) -> str:
     return "Assistant is currently unavailable. Please try again later."
 
 
+def _start_console_log() -> QueueListener:
+    """Echo gateway INFO logs to stdout from a listener thread.
+
+    Message handlers only enqueue records, so a slow terminal never stalls
+    routing. Call .stop() on the returned listener to flush it.
+    """
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(records, console)
+    listener.start()
+    log.addHandler(QueueHandler(records))
+    log.setLevel(logging.INFO)
+    return listener
+
+
+def _wait_for_shutdown() -> None:
+    """Block until Ctrl+C or SIGTERM without waking up in between."""
+    stop = threading.Event()
+    if threading.current_thread() is not threading.main_thread():
+        stop.wait()  # signal handlers can only be installed from the main thread
+        return
+
+    previous = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+    for sig in previous:
+        signal.signal(sig, lambda *_: stop.set())
+    try:
+        stop.wait()
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+
+
+def _start_event_loop() -> asyncio.AbstractEventLoop:
+    """Run the gateway's asyncio loop on a daemon thread and return it.
+
+    Channels poll and the message router runs on this one loop.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True, name="ltl-gateway-loop").start()
+    return loop
+
+
 def start_background(cfg: dict) -> list[str]:
     """Start the gateway in background threads (non-blocking).
 
     Returns the list of enabled channel names, or [] if none configured.
     Called automatically by the TUI on startup.
     """
-    bus = get_bus()
+    from ltl.channels import get_manager
+
+    bus = get_bus(cfg.get("bus", {}).get("max_inbound"))
     bus.start()
 
     manager = get_manager(bus)
@@ -117,12 +335,16 @@ def start_background(cfg: dict) -> list[str]:
 
     telegram_config = channels_config.get("telegram", {})
     if telegram_config.get("enabled", False):
+        from ltl.channels.telegram import create_telegram_channel
+
         ch = create_telegram_channel(bus, telegram_config)
         if ch:
             manager.register_channel(ch)
 
     discord_config = channels_config.get("discord", {})
     if discord_config.get("enabled", False):
+        from ltl.channels.discord import create_discord_channel
+
         ch = create_discord_channel(bus, discord_config)
         if ch:
             manager.register_channel(ch)
@@ -131,11 +353,12 @@ def start_background(cfg: dict) -> list[str]:
     if not registered:
         return []
 
-    manager.start_all()
+    loop = _start_event_loop()
+    manager.start_all(loop)
 
-    rlm_holder: dict = {"client": None}
+    rlm_holder: dict = {"client": None, "clients": ClientCache(), "stream": _stream_enabled(cfg)}
     try:
-        rlm_holder["client"] = RLMClient(cfg)
+        rlm_holder["client"] = rlm_holder["clients"].get(cfg)
     except Exception:
         pass
 
@@ -146,12 +369,15 @@ def start_background(cfg: dict) -> list[str]:
         ch._config = cfg
         ch._rlm_holder = rlm_holder
 
-    threading.Thread(target=process_messages, args=(rlm_holder, components), daemon=True).start()
+    asyncio.run_coroutine_threadsafe(process_messages(rlm_holder, components, manager.channels), loop)
     return registered
 
 
 def run(args):
     """Run the gateway command."""
+    from ltl.channels import get_manager
+    from ltl.core.config import load_config
+
     print("🎙️  LTL Gateway\n")
     print("=" * 60)
 
@@ -163,7 +389,7 @@ def run(args):
         return
 
     # Initialize message bus
-    bus = get_bus()
+    bus = get_bus(cfg.get("bus", {}).get("max_inbound"))
     bus.start()
 
     # Initialize channel manager
@@ -174,12 +400,16 @@ def run(args):
 
     telegram_config = channels_config.get("telegram", {})
     if telegram_config.get("enabled", False):
+        from ltl.channels.telegram import create_telegram_channel
+
         telegram_channel = create_telegram_channel(bus, telegram_config)
         if telegram_channel:
             manager.register_channel(telegram_channel)
 
     discord_config = channels_config.get("discord", {})
     if discord_config.get("enabled", False):
+        from ltl.channels.discord import create_discord_channel
+
         discord_channel = create_discord_channel(bus, discord_config)
         if discord_channel:
             manager.register_channel(discord_channel)
@@ -204,11 +434,12 @@ def run(args):
     print(f"✓ Channels enabled: {', '.join(enabled_channels)}")
     print("✓ Message bus started")
 
-    manager.start_all()
+    loop = _start_event_loop()
+    manager.start_all(loop)
 
-    rlm_holder: dict = {"client": None}
+    rlm_holder: dict = {"client": None, "clients": ClientCache(), "stream": _stream_enabled(cfg)}
     try:
-        rlm_holder["client"] = RLMClient(cfg)
+        rlm_holder["client"] = rlm_holder["clients"].get(cfg)
         print("✓ RLMClient ready")
     except Exception as e:
         print(f"⚠️  RLMClient unavailable ({e}) — falling back to echo")
@@ -222,51 +453,106 @@ def run(args):
         ch._config = cfg
         ch._rlm_holder = rlm_holder
 
-    processing_thread = threading.Thread(
-        target=process_messages, args=(rlm_holder, components), daemon=True
-    )
-    processing_thread.start()
+    console_log = _start_console_log()
+    asyncio.run_coroutine_threadsafe(process_messages(rlm_holder, components, manager.channels), loop)
 
     print("\n✅ Gateway started! Press Ctrl+C to stop")
     print("=" * 60)
 
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        print("\n\n🛑 Shutting down gateway...")
+    _wait_for_shutdown()
+    print("\n\n🛑 Shutting down gateway...")
 
     manager.stop_all()
     bus.stop()
+    loop.call_soon_threadsafe(loop.stop)
+    console_log.stop()
     print("✅ Gateway stopped")
 
 
-def process_messages(rlm_holder: dict, components: dict):
-    """Process inbound messages using the full agent framework.
-
-    Args:
-        rlm_holder:  {"client": RLMClient | None} — mutable for /model hot-swap.
-        components:  {"orchestrator", "tool_executor", "web_search"} from _init_agent_components.
-    """
-    bus = get_bus()
-
-    while True:
-        try:
-            msg = bus.consume_inbound(timeout=1.0)
-            if not msg:
-                continue
+async def _handle_one(msg, rlm_holder: dict, components: dict, channels: dict, outbox: asyncio.Queue):
+    """Route one inbound message and deliver the reply."""
+    try:
+        log.info("📨 [%s] %s: %.50s...", msg.channel, msg.sender_id, msg.content)
 
-            print(f"📨 [{msg.channel}] {msg.sender_id}: {msg.content[:50]}...")
+        response = await _route_message(msg.content, rlm_holder, components)
 
-            response = _route_message(msg.content, rlm_holder, components)
+        channel = channels.get(msg.channel)
+        if not isinstance(response, str):
+            if channel:
+                await channel.stream_message(msg.chat_id, response)
+                return
+            response = "".join([chunk async for chunk in response])
 
-            bus.publish_outbound(OutboundMessage(
+        if channel:
+            await asyncio.to_thread(channel.send_message, msg.chat_id, response)
+        else:
+            outbox.put_nowait(OutboundMessage(
                 channel=msg.channel,
                 chat_id=msg.chat_id,
                 content=response,
-                timestamp=time.time(),
             ))
 
-        except Exception as e:
-            print(f"❌ Message processing error: {e}")
-            time.sleep(1)
+    except Exception:
+        log.exception("❌ Message processing error")
+
+
+async def _batch_outbound(outbox: asyncio.Queue):
+    """Forward replies from outbox to the bus in batches until a None arrives."""
+    bus = get_bus()
+    loop = asyncio.get_running_loop()
+    done = False
+    while not done:
+        msg = await outbox.get()
+        if msg is None:
+            return
+        batch = [msg]
+        deadline = loop.time() + _OUTBOUND_BATCH_WINDOW
+        while len(batch) < _OUTBOUND_BATCH_SIZE:
+            try:
+                msg = await asyncio.wait_for(outbox.get(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                break
+            if msg is None:
+                done = True
+                break
+            batch.append(msg)
+        bus.publish_outbound_batch(batch)
+
+
+async def process_messages(rlm_holder: dict, components: dict, channels: dict | None = None):
+    """Process inbound messages using the full agent framework.
+
+    Each message is handled in its own task so slow LLM/search round-trips
+    overlap; at most _MAX_CONCURRENT_MESSAGES are in flight; beyond that the
+    loop stops pulling from the bus and the inbound queue absorbs the burst.
+
+    Args:
+        rlm_holder:  {"client": RLMClient | None, "clients": ClientCache, "stream": bool}
+                     — mutable for /model hot-swap.
+        components:  {"orchestrator", "tool_executor", "web_search", "semantic_cache"}
+                     from _init_agent_components.
+        channels:    {name: Channel} — replies go straight to channel.send_message();
+                     channels not listed here fall back to the bus outbound queue,
+                     published in batches by _batch_outbound.
+    """
+    channels = channels or {}
+    bus = get_bus()
+    sem = asyncio.Semaphore(_MAX_CONCURRENT_MESSAGES)
+    tasks: set[asyncio.Task] = set()
+    outbox: asyncio.Queue = asyncio.Queue()
+    batcher = asyncio.create_task(_batch_outbound(outbox))
+
+    def _done(task: asyncio.Task):
+        tasks.discard(task)
+        sem.release()
+
+    async for msg in bus.aiter_inbound():
+        await sem.acquire()
+        task = asyncio.create_task(_handle_one(msg, rlm_holder, components, channels, outbox))
+        tasks.add(task)
+        task.add_done_callback(_done)
+
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    outbox.put_nowait(None)
+    await batcher
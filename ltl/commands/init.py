@@ -1,9 +1,6 @@
 """Init command - Initialize workspace and configuration."""
 
 import os
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from ltl.core.workspace import create_workspace, get_workspace_path
 from ltl.core.config import create_default_config, get_config_path
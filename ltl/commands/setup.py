@@ -4,12 +4,7 @@ import os
 import sys
 import subprocess
 import platform
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
-from ltl.core.config import load_config, save_config
-from ltl.core.localai import update_config_for_localai
-from ltl.core.whisper import setup_channel_transcription
+from importlib.util import find_spec
 
 
 def run(args):
@@ -68,6 +63,8 @@ def setup_localai():
 
     # Update config
     print("\n📄 Updating LTL configuration...")
+    from ltl.core.localai import update_config_for_localai
+
     update_config_for_localai()
 
     print("\n✅ LocalAI setup complete!")
@@ -80,12 +77,10 @@ def setup_whisper():
     print("🎤 Setting up Whisper for voice transcription\n")
     print("Whisper is open-source speech recognition from OpenAI.\n")
 
-    # Check if whisper is already available
-    try:
-        import openai_whisper
-
+    # Check if whisper is already available (without importing torch)
+    if find_spec("whisper") is not None:
         print("✅ openai-whisper already installed")
-    except ImportError:
+    else:
         print("📦 Installing openai-whisper...")
         try:
             subprocess.check_call([sys.executable, "-m", "pip", "install", "openai-whisper"])
@@ -110,9 +105,39 @@ def setup_whisper():
 
     # Update config
     print("\n📄 Updating LTL configuration...")
+    from ltl.core.whisper import setup_channel_transcription
+
     setup_channel_transcription()
     print("✅ Whisper configured in LTL")
 
+    setup_tui_whisper()
+
+
+def setup_tui_whisper():
+    """Install faster-whisper in ~/whisper-env and download its tiny model.
+
+    TUI voice input transcribes there with the int8 CTranslate2 model;
+    fetching it now keeps the download out of the first /record.
+    """
+    whisper_python = os.path.join(os.path.expanduser("~/whisper-env"), "bin", "python3")
+    if not os.path.exists(whisper_python):
+        return
+
+    print("\n📦 Installing faster-whisper in ~/whisper-env...")
+    try:
+        subprocess.check_call([whisper_python, "-m", "pip", "install", "faster-whisper"])
+        print("⬇️  Downloading the tiny int8 model...")
+        subprocess.check_call(
+            [
+                whisper_python,
+                "-c",
+                "from faster_whisper import WhisperModel; WhisperModel('tiny', device='cpu', compute_type='int8')",
+            ]
+        )
+        print("✅ faster-whisper ready for TUI voice input")
+    except subprocess.CalledProcessError:
+        print("⚠️ faster-whisper setup failed - TUI voice input will use openai-whisper")
+
 
 def run_docker_localai():
     """Run LocalAI with Docker."""
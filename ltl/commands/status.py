@@ -1,14 +1,20 @@
 """Status command - Show system status."""
 
 import os
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from ltl.core.config import load_config, get_config_path
 from ltl.core.workspace import get_workspace_path
 
 
+def _dir_entries(path: str) -> set[str] | None:
+    """Names in directory path from a single read, or None if it can't be listed."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return None
+
+
 def run(args):
     """Run the status command."""
     print("🎙️  LTL Status\n")
@@ -34,21 +40,20 @@ def run(args):
 
     # Workspace status
     workspace_path = get_workspace_path()
-    if os.path.exists(workspace_path):
+    entries = _dir_entries(workspace_path)
+    if entries is not None:
         print(f"\n✓ Workspace: {workspace_path}")
 
-        # Check for template files
+        # Check for template files (one directory read instead of a stat per file)
         templates = ["AGENTS.md", "USER.md", "IDENTITY.md", "SOUL.md", "TOOLS.md"]
         for template in templates:
-            template_path = os.path.join(workspace_path, template)
-            if os.path.exists(template_path):
+            if template in entries:
                 print(f"  ✓ {template}")
             else:
                 print(f"  ✗ {template}")
 
         # Check for MEMORY.md in memory subdirectory
-        memory_path = os.path.join(workspace_path, "memory", "MEMORY.md")
-        if os.path.exists(memory_path):
+        if "MEMORY.md" in (_dir_entries(os.path.join(workspace_path, "memory")) or ()):
             print(f"  ✓ memory/MEMORY.md")
         else:
             print(f"  ✗ memory/MEMORY.md")
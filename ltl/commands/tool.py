@@ -1,13 +1,36 @@
 """Tool command - Execute tools from CLI."""
 
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import re
 
 from ltl.core.tools import get_registry
 from ltl.tools import register_builtin_tools
 
+# key=value tool arguments; keys must be identifiers so they can be passed as kwargs
+_KV_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)=(.*)", re.DOTALL)
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?")
+_BOOLS = {"true": True, "false": False}
+
+
+def _coerce(value: str):
+    """Convert a CLI value to int, float or bool where it looks like one."""
+    if _INT_RE.fullmatch(value):
+        return int(value)
+    if _FLOAT_RE.fullmatch(value):
+        return float(value)
+    return _BOOLS.get(value.lower(), value)
+
+
+def parse_tool_kwargs(parts) -> dict:
+    """Turn key=value arguments into tool kwargs, coercing values; other parts are ignored."""
+    kwargs = {}
+    for part in parts:
+        m = _KV_RE.fullmatch(part)
+        if m:
+            key, value = m.groups()
+            kwargs[key] = _coerce(value)
+    return kwargs
+
 
 def run(args):
     """Run the tool command."""
@@ -40,30 +63,8 @@ def run(args):
             print(f"  - {name}")
         return
 
-    # Parse remaining arguments as tool parameters
-    tool_args = {}
-    if args.tool_args:
-        # Simple argument parsing: key=value pairs
-        for arg in args.tool_args:
-            if "=" in arg:
-                key, value = arg.split("=", 1)
-                # Try to convert value to appropriate type
-                try:
-                    # Try integer
-                    tool_args[key] = int(value)
-                except ValueError:
-                    try:
-                        # Try float
-                        tool_args[key] = float(value)
-                    except ValueError:
-                        # Try boolean
-                        if value.lower() == "true":
-                            tool_args[key] = True
-                        elif value.lower() == "false":
-                            tool_args[key] = False
-                        else:
-                            # Keep as string
-                            tool_args[key] = value
+    # Parse remaining arguments as tool parameters (key=value pairs)
+    tool_args = parse_tool_kwargs(args.tool_args or [])
 
     # Execute the tool
     print(f"🔧 Executing: {tool_name}")
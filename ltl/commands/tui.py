@@ -1,35 +1,260 @@
 """TUI command - Unified terminal interface for LTL."""
 
+import argparse
+import functools
+import glob
 import os
+import re
+import select
+import shlex
+import signal
+import socket
 import sys
 import asyncio
 import threading
 import time
-import select
-from typing import Optional, List
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from collections import deque
+from queue import Empty, SimpleQueue
+from typing import Optional
+from urllib.parse import urlparse
 
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
+from rich.spinner import Spinner
 from rich.text import Text
-from rich.live import Live
-from rich.columns import Columns
-from rich.layout import Layout
-from rich.table import Table
-from rich.markdown import Markdown
 
 from ltl.core.config import load_config
-from ltl.commands.chat import TextChatAssistant
-from ltl.commands.gateway import start_background as start_gateway_background
+from ltl.commands.chat import ChatCancelled, TextChatAssistant
+from ltl.commands.gateway import run as gateway_run, start_background as start_gateway_background
+
+# Seconds a /help or /status Ollama probe result is reused
+_OLLAMA_CHECK_TTL = 5.0
+
+# Messages kept for /status; older ones are dropped
+_CHAT_HISTORY_MAX = 1024
+
+# Sentence boundary in a streamed reply: end punctuation or newline, then whitespace
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+
+# Redraws per second of a reply while it streams
+_LIVE_REFRESH_HZ = 20
 
-# Optional TTS import
-try:
-    from tts import TextToSpeechService
+_PROMPT = "\n🎙️ You: "
 
-    TTS_AVAILABLE = True
-except ImportError:
-    TTS_AVAILABLE = False
+# Static part of the /help panel, below the status lines
+_WELCOME_COMMANDS = (
+    "Commands:\n"
+    "  /chat     - Text chat mode\n"
+    "  /voice    - Voice input mode\n"
+    "  /record   - Start voice recording\n"
+    "  /speak    - Voice input mode\n"
+    "  /tools    - Execute tools\n"
+    "  /tool_reload - Re-register tools\n"
+    "  /status   - System status\n"
+    "  /gateway  - Channel gateway\n"
+    "  /config   - Configuration\n"
+    "  /refresh  - Re-check voice, TTS and Ollama\n"
+    "  /clear    - Clear chat history\n"
+    "  /help     - Show this help\n"
+    "  /exit     - Exit LTL\n\n"
+    "Just type your message to chat, or use /voice for speech!"
+)
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+_TTS_VENV = os.path.join(_REPO_ROOT, ".venv311")
+_WHISPER_VENV = os.path.expanduser("~/whisper-env")
+
+
+def _wait_for_key(timeout: float) -> None:
+    """Return on the first keystroke or after timeout seconds.
+
+    The terminal is put in cbreak mode so any key counts, not just Enter.
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        import termios
+        import tty
+
+        fd = sys.stdin.fileno()
+        old = termios.tcgetattr(fd)
+    except Exception:
+        fd, old = None, None
+    try:
+        if old is not None:
+            tty.setcbreak(fd)
+        while (remaining := deadline - time.monotonic()) > 0:
+            ready, _, _ = select.select([sys.stdin], [], [], min(remaining, 0.1))
+            if ready:
+                os.read(sys.stdin.fileno(), 1024)
+                return
+    finally:
+        if old is not None:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+
+def _venv_has_packages(venv_dir: str, *names: str) -> bool:
+    """True if every named package/module is installed in the venv at venv_dir.
+
+    Looks in site-packages instead of importing, so probing for whisper or
+    piper doesn't start a Python that loads torch.
+    """
+    for site_packages in glob.glob(os.path.join(venv_dir, "lib", "python3*", "site-packages")):
+        if all(
+            os.path.isdir(os.path.join(site_packages, name)) or os.path.isfile(os.path.join(site_packages, name + ".py"))
+            for name in names
+        ):
+            return True
+    return False
+
+
+def _ollama_address(config: dict) -> tuple:
+    """(host, port) of the configured Ollama server."""
+    base_url = config.get("providers", {}).get("ollama", {}).get("base_url", "http://localhost:11434")
+    url = urlparse(base_url)
+    try:
+        port = url.port
+    except ValueError:
+        port = None
+    return url.hostname or "localhost", port or (443 if url.scheme == "https" else 80)
+
+
+# Shared by every LTLTUI created in this process, so a restart reuses its clients
+_chat_assistant = None
+
+
+def _get_chat_assistant(config: dict) -> TextChatAssistant:
+    """Get the process-wide chat assistant, creating it on first use."""
+    global _chat_assistant
+    if _chat_assistant is None:
+        _chat_assistant = TextChatAssistant(config)
+    return _chat_assistant
+
+
+def _reply_panel(text: Text) -> Panel:
+    return Panel(text, title="🤖 LTL", border_style="green")
+
+
+class _LiveReply:
+    """Shows a reply in place as it streams in.
+
+    A "Thinking..." spinner is shown until the first token; then the reply
+    panel takes its place and grows as tokens are appended. Rich redraws the
+    region at most _LIVE_REFRESH_HZ times a second, so long replies aren't
+    re-printed per token. Tokens are also passed on to the speaker, if any.
+    """
+
+    def __init__(self, console: Console, speaker: Optional["_SentenceSpeaker"] = None):
+        self._speaker = speaker
+        self._text = Text()
+        self._cancelled = False
+        self.started = False
+        self.live = Live(
+            Spinner("dots", "[green]Thinking..."),
+            console=console,
+            refresh_per_second=_LIVE_REFRESH_HZ,
+            vertical_overflow="visible",
+        )
+
+    def __enter__(self):
+        self.live.start()
+        return self
+
+    def __exit__(self, *exc):
+        if not self.started:
+            self.live.transient = True  # don't leave the spinner behind
+        self.live.stop()
+
+    def __call__(self, token: str):
+        if self._cancelled:
+            raise ChatCancelled  # stops the worker's stream
+        if self._speaker:
+            self._speaker(token)
+        self._text.append(token)
+        if not self.started:
+            self.started = True
+            self.live.update(_reply_panel(self._text))
+
+    def cancel(self):
+        """Stop the abandoned request at the next token it produces."""
+        self._cancelled = True
+
+
+class _SentenceSpeaker:
+    """Speaks a streamed reply sentence by sentence while it is still generating.
+
+    Called with each token (as TextChatAssistant.chat's on_token); complete
+    sentences are queued for a background thread that sends whatever has
+    accumulated to the TTS worker, so playback overlaps generation.
+    """
+
+    def __init__(self, worker):
+        self._worker = worker
+        self._buf = ""
+        self._queue: SimpleQueue = SimpleQueue()
+        self._cancelled = False
+        self._error: Optional[Exception] = None
+        self._thread = threading.Thread(target=self._run, daemon=True, name="ltl-tts-speaker")
+        self._thread.start()
+
+    def __call__(self, token: str):
+        if self._cancelled:
+            return
+        self._buf += token
+        end = None
+        for end in _SENTENCE_END_RE.finditer(self._buf):
+            pass
+        if end is not None:
+            self._queue.put(self._buf[: end.end()])
+            self._buf = self._buf[end.end() :]
+
+    def close(self):
+        """Queue the unfinished last sentence and wait until everything is spoken."""
+        if self._buf.strip():
+            self._queue.put(self._buf)
+        self._buf = ""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error:
+            raise self._error
+
+    def cancel(self):
+        """Stop speaking after the current sentence; later tokens are ignored."""
+        self._cancelled = True
+        self._queue.put(None)
+
+    def _run(self):
+        done = False
+        while not done:
+            pieces = [self._queue.get()]
+            while True:  # take everything queued while the last batch played
+                try:
+                    pieces.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            if None in pieces:
+                done = True
+                pieces = pieces[: pieces.index(None)]
+            text = " ".join(p.strip() for p in pieces if p.strip())
+            if not text or self._cancelled or self._error:
+                continue
+            try:
+                self._worker.speak(text)
+            except Exception as e:
+                self._error = e
+
+
+def _use_uvloop():
+    """Make asyncio create uvloop event loops, if uvloop is installed (not on Windows)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 class LTLTUI:
@@ -38,16 +263,30 @@ class LTLTUI:
     def __init__(self):
         self.console = Console()
         self.config = load_config()
-        self.chat_assistant = TextChatAssistant(self.config)
+        self.chat_assistant = _get_chat_assistant(self.config)
         self.running = False
-        self.voice_enabled = False
-        self.tts_enabled = False
         self.current_mode = "chat"
-        self.chat_history: List[str] = []
-
-        # Check for voice components
-        self.voice_enabled = self._check_voice_components()
-        self.tts_enabled = self._check_tts_components()
+        self.chat_history: deque[tuple[str, str]] = deque(maxlen=_CHAT_HISTORY_MAX)  # (role, text)
+        self._ollama_cache = (float("-inf"), False)  # (monotonic time, reachable)
+        self._ollama_address = _ollama_address(self.config)
+        self._welcome_panels: dict[tuple, Panel] = {}  # keyed on the status line values
+        # Exact (lowercased) command -> handler; a truthy return exits the TUI
+        self._cmd_table = {
+            "/exit": self._cmd_exit,
+            "/quit": self._cmd_exit,
+            "/clear": self._cmd_clear,
+            "/status": self.show_status,
+            "/help": self.show_welcome,
+            "/chat": self._cmd_chat,
+            "/voice": self.handle_voice_command,
+            "/record": self.handle_voice_input,
+            "/speak": self.handle_voice_input,
+            "/tools": self.show_tools,
+            "/tool_reload": self._cmd_tool_reload,
+            "/gateway": self.start_gateway,
+            "/config": self.show_config,
+            "/refresh": self._cmd_refresh,
+        }
 
         # Auto-start gateway (Telegram, Discord) in background if configured
         self.active_channels = []
@@ -58,106 +297,56 @@ class LTLTUI:
         except Exception as e:
             self.console.print(f"[yellow]⚠️  Gateway unavailable: {e}[/yellow]")
 
-        # TTS will be initialized on-demand using subprocess
+        # Voice input and TTS run in worker processes started on first use
+
+    @functools.cached_property
+    def voice_enabled(self) -> bool:
+        """Voice input is available (checked on first use)."""
+        return self._check_voice_components()
+
+    @functools.cached_property
+    def tts_enabled(self) -> bool:
+        """Voice output is available (checked on first use)."""
+        return self._check_tts_components()
 
     def _check_voice_components(self) -> bool:
         """Check if voice components are available."""
-        try:
-            # Check if whisper venv exists and has packages
-            whisper_venv = os.path.expanduser("~/whisper-env")
-            if os.path.exists(whisper_venv):
-                # Try to import from venv
-                import sys
-                import subprocess
-
-                # Use the venv python to test imports
-                venv_python = os.path.join(whisper_venv, "bin", "python3")
-                if os.path.exists(venv_python):
-                    result = subprocess.run(
-                        [venv_python, "-c", "import whisper, sounddevice; print('OK')"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    return result.returncode == 0 and "OK" in result.stdout
-
-            return False
-        except Exception:
+        # Recording runs in the whisper venv, so that's where the packages must be
+        if not os.path.exists(os.path.join(_WHISPER_VENV, "bin", "python3")):
             return False
+        return _venv_has_packages(_WHISPER_VENV, "sounddevice") and (
+            _venv_has_packages(_WHISPER_VENV, "faster_whisper") or _venv_has_packages(_WHISPER_VENV, "whisper")
+        )
 
     def _check_tts_components(self) -> bool:
         """Check if TTS components are available."""
-        try:
-            # Check if voice model exists
-            voice_path = os.path.expanduser("~/.local/share/piper/en_US-lessac-medium.onnx")
-            if not os.path.exists(voice_path):
-                return False
-
-            # Try to test TTS in venv
-            import subprocess
-
-            venv_python = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                ".venv311",
-                "bin",
-                "python3",
-            )
-
-            if os.path.exists(venv_python):
-                result = subprocess.run(
-                    [
-                        venv_python,
-                        "-c",
-                        """
-import sys
-sys.path.insert(0, '.')
-try:
-    from tts import TextToSpeechService
-    tts = TextToSpeechService()
-    sample_rate, audio = tts.synthesize('test')
-    print('OK' if len(audio) > 0 else 'FAIL')
-except Exception as e:
-    print(f'ERROR: {e}')
-""",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                )
-                return result.returncode == 0 and "OK" in result.stdout
-
+        # Check if voice model exists
+        voice_path = os.path.expanduser("~/.local/share/piper/en_US-lessac-medium.onnx")
+        if not os.path.exists(voice_path):
             return False
-        except Exception as e:
-            print(f"TTS check failed: {e}")
+
+        # Speech is synthesized by tts.py in the project venv
+        if not os.path.exists(os.path.join(_TTS_VENV, "bin", "python3")):
             return False
+        return _venv_has_packages(_TTS_VENV, "piper", "sounddevice")
 
     def show_welcome(self):
         """Show welcome screen."""
         self.console.clear()
-        title_panel = Panel(
-            "🎙️ Welcome to LTL - Local Talking LLM\n\n"
-            "Your privacy-first AI assistant with voice, vision, and tools.\n\n"
-            f"Voice Input: {'✅ Enabled' if self.voice_enabled else '❌ Disabled'}\n"
-            f"Voice Output: {'✅ Enabled' if self.tts_enabled else '❌ Disabled'}\n"
-            f"Ollama: {'✅ Connected' if self._check_ollama() else '❌ Not connected'}\n"
-            f"Telegram: {'✅ ' + ', '.join(self.active_channels) if self.active_channels else '❌ Not configured'}\n\n"
-            "Commands:\n"
-            "  /chat     - Text chat mode\n"
-            "  /voice    - Voice input mode\n"
-            "  /record   - Start voice recording\n"
-            "  /speak    - Voice input mode\n"
-            "  /tools    - Execute tools\n"
-            "  /status   - System status\n"
-            "  /gateway  - Channel gateway\n"
-            "  /config   - Configuration\n"
-            "  /clear    - Clear chat history\n"
-            "  /help     - Show this help\n"
-            "  /exit     - Exit LTL\n\n"
-            "Just type your message to chat, or use /voice for speech!",
-            title="LTL Assistant",
-            border_style="blue",
-        )
+        key = (self.voice_enabled, self.tts_enabled, self._check_ollama(), tuple(self.active_channels))
+        title_panel = self._welcome_panels.get(key)
+        if title_panel is None:
+            voice, tts, ollama, channels = key
+            title_panel = self._welcome_panels[key] = Panel(
+                "🎙️ Welcome to LTL - Local Talking LLM\n\n"
+                "Your privacy-first AI assistant with voice, vision, and tools.\n\n"
+                f"Voice Input: {'✅ Enabled' if voice else '❌ Disabled'}\n"
+                f"Voice Output: {'✅ Enabled' if tts else '❌ Disabled'}\n"
+                f"Ollama: {'✅ Connected' if ollama else '❌ Not connected'}\n"
+                f"Telegram: {'✅ ' + ', '.join(channels) if channels else '❌ Not configured'}\n\n" + _WELCOME_COMMANDS,
+                title="LTL Assistant",
+                border_style="blue",
+            )
         self.console.print(title_panel)
 
     def show_status(self):
@@ -167,7 +356,7 @@ except Exception as e:
             f"Mode: {self.current_mode.upper()}\n"
             f"Voice: {'✅' if self.voice_enabled else '❌'}\n"
             f"Ollama: {'✅' if self._check_ollama() else '❌'}\n"
-            f"Channels: {self._get_channel_status()}\n"
+            f"Channels: {self._channel_status}\n"
             f"Chat History: {len(self.chat_history)} messages\n\n"
             f"Config: {self.config.get('version', 'unknown')}",
             title="System Status",
@@ -179,37 +368,39 @@ except Exception as e:
         """Handle special commands. Returns True if should exit."""
         cmd = command.lower().strip()
 
-        if cmd == "/exit" or cmd == "/quit":
-            return True
-        elif cmd == "/clear":
-            self.chat_history.clear()
-            self.chat_assistant.chat_history.clear()
-            self.console.print("[green]🧹 Chat history cleared[/green]")
-        elif cmd == "/status":
-            self.show_status()
-        elif cmd == "/help":
-            self.show_welcome()
-        elif cmd == "/chat":
-            self.current_mode = "chat"
-            self.console.print("[blue]📝 Switched to text chat mode[/blue]")
-        elif cmd == "/voice":
-            self.handle_voice_command()
-        elif cmd == "/record" or cmd == "/speak":
-            self.handle_voice_input()
-        elif cmd == "/tools":
-            self.show_tools()
-        elif cmd.startswith("/tool "):
-            self.execute_tool_command(cmd)
-        elif cmd == "/gateway":
-            self.start_gateway()
-        elif cmd == "/config":
-            self.show_config()
+        handler = self._cmd_table.get(cmd)
+        if handler is not None:
+            return bool(handler())
+        if cmd.startswith("/tool "):
+            # Pass the original text so quoted argument values keep their case
+            self.execute_tool_command(command.strip())
         else:
             # Not a command, treat as chat message
             self.handle_chat(command)
-
         return False
 
+    def _cmd_exit(self) -> bool:
+        return True
+
+    def _cmd_clear(self):
+        self.chat_history.clear()
+        self.chat_assistant.chat_history.clear()
+        self.console.print("[green]🧹 Chat history cleared[/green]")
+
+    def _cmd_refresh(self):
+        # Voice/TTS checks are kept for the session and Ollama's for a few
+        # seconds; drop them so newly installed components show up now
+        for attr in ("voice_enabled", "tts_enabled"):
+            self.__dict__.pop(attr, None)
+        self._ollama_cache = (float("-inf"), False)
+        self._welcome_panels.clear()
+        self.console.print("[green]🔄 Component checks refreshed[/green]")
+        self.show_status()
+
+    def _cmd_chat(self):
+        self.current_mode = "chat"
+        self.console.print("[blue]📝 Switched to text chat mode[/blue]")
+
     def handle_voice_command(self):
         """Handle voice mode command."""
         if self.voice_enabled:
@@ -223,277 +414,168 @@ except Exception as e:
             self.console.print("[red]❌ Voice not available. Install whisper and sounddevice.[/red]")
             self.console.print("[yellow]Run: ltl setup whisper[/yellow]")
 
+    @functools.cached_property
+    def _asr_worker(self):
+        """Persistent recording/transcription process in ~/whisper-env."""
+        from ltl.core.asr_worker import AsrWorker
+
+        return AsrWorker(os.path.join(_WHISPER_VENV, "bin", "python3"))
+
     def handle_voice_input(self):
         """Handle voice input recording."""
         if not self.voice_enabled:
             self.console.print("[red]❌ Voice not available[/red]")
             return
 
-        import os
-
-        try:
-            # Use the whisper-env python for voice processing
-            whisper_venv = os.path.expanduser("~/whisper-env")
-            venv_python = os.path.join(whisper_venv, "bin", "python3")
-
-            if not os.path.exists(venv_python):
-                self.console.print("[red]❌ Whisper environment not found[/red]")
-                return
+        from ltl.core.asr_worker import MAX_SECONDS
 
-            # Create a simple voice recording script
-            voice_script = """
-import sys
-import numpy as np
-import sounddevice as sd
-import whisper
-import time
-
-print("🎤 Recording... Press Enter to stop", flush=True)
-
-# Get device's native sample rate
-import sounddevice as sd
-try:
-    device_info = sd.query_devices(sd.default.device[0], "input")
-    samplerate = int(device_info["default_samplerate"])
-    print(f"Using device sample rate: {samplerate} Hz", flush=True)
-except:
-    samplerate = 44100  # Common fallback
-    print(f"Using fallback sample rate: {samplerate} Hz", flush=True)
-
-duration = 10  # Max 10 seconds
-recording = []
-
-def callback(indata, frames, time_info, status):
-    recording.append(indata.copy())
-
-try:
-    stream = sd.InputStream(samplerate=samplerate, channels=1, dtype="float32", callback=callback)
-    with stream:
-        input()  # Wait for Enter
-        stream.stop()
-except Exception as e:
-    print(f"Recording failed: {e}", flush=True)
-    sys.exit(1)
-
-if recording:
-    # Concatenate audio
-    audio = np.concatenate(recording, axis=0).flatten()
-
-    # Resample to 16kHz for Whisper if needed
-    if samplerate != 16000:
-        print(f"Resampling from {samplerate} Hz to 16000 Hz for Whisper...", flush=True)
         try:
-            from scipy.signal import resample_poly
-            from math import gcd
-            factor = gcd(samplerate, 16000)
-            up = 16000 // factor
-            down = samplerate // factor
-            audio = resample_poly(audio, up, down).astype(np.float32)
-        except ImportError:
-            # Fallback: simple linear interpolation if scipy not available
-            print("scipy not available, using simple resampling...", flush=True)
-            length_ratio = 16000 / samplerate
-            new_length = int(len(audio) * length_ratio)
-            indices = np.arange(new_length) / length_ratio
-            audio = np.interp(indices, np.arange(len(audio)), audio).astype(np.float32)
-
-    # Load and use whisper
-    print("Transcribing...", flush=True)
-    model = whisper.load_model("tiny")
-    result = model.transcribe(audio, fp16=False)
-    text = result["text"].strip()
-
-    if text:
-        print(f"TRANSCRIBED: {text}", flush=True)
-    else:
-        print("NO_SPEECH", flush=True)
-else:
-    print("NO_AUDIO", flush=True)
-"""
-
-            # Write script to temp file and execute
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-                f.write(voice_script)
-                script_path = f.name
-
-            try:
-                import subprocess
-
-                self.console.print("[green]🎤 Recording... Press Enter to stop[/green]")
-
-                # Run the voice script
-                result = subprocess.run([venv_python, script_path], capture_output=True, text=True, timeout=30)
-
-                if result.returncode == 0:
-                    output = result.stdout.strip()
-                    if output.startswith("TRANSCRIBED: "):
-                        text = output[12:]  # Remove "TRANSCRIBED: " prefix
-                        self.console.print(f"[green]🎤 Heard: {text}[/green]")
-                        # Process as chat message
-                        self.handle_chat(text)
-                    elif output == "NO_SPEECH":
-                        self.console.print("[yellow]No speech detected[/yellow]")
-                    elif output == "NO_AUDIO":
-                        self.console.print("[yellow]No audio recorded[/yellow]")
-                    else:
-                        self.console.print(f"[yellow]Recording result: {output}[/yellow]")
-                else:
-                    self.console.print(f"[red]❌ Recording failed: {result.stderr}[/red]")
-
-            finally:
-                # Clean up temp file
-                import os
-
-                try:
-                    os.unlink(script_path)
-                except:
-                    pass
-
+            self._asr_worker.start_recording()
+            self.console.print(f"[green]🎤 Recording... Press any key to stop (max {MAX_SECONDS}s)[/green]")
+            _wait_for_key(MAX_SECONDS)
+            with self.console.status("[green]Transcribing...", spinner="dots"):
+                text = self._asr_worker.finish()
         except Exception as e:
             self.console.print(f"[red]❌ Voice recording failed: {e}[/red]")
             self.console.print("[yellow]Make sure microphone is available[/yellow]")
+            return
+
+        if text:
+            self.console.print(f"[green]🎤 Heard: {text}[/green]")
+            # Process as chat message
+            self.handle_chat(text)
+        else:
+            self.console.print("[yellow]No speech detected[/yellow]")
 
     def handle_chat(self, message: str):
         """Handle chat message."""
         # Add to history
-        self.chat_history.append(f"You: {message}")
+        self.chat_history.append(("You", message))
+
+        speaker = self._new_speaker()
+        reply = _LiveReply(self.console, speaker)
+        with reply:
+            response = self.chat_assistant.chat(message, on_token=reply)
 
-        # Show thinking indicator
-        with self.console.status("[green]Thinking...", spinner="dots"):
-            response = self.chat_assistant.chat(message)
+        self._show_response(response, speaker, shown=reply.started)
 
+    async def handle_chat_async(self, message: str):
+        """Handle chat message, running the model call on a worker thread.
+
+        The event loop stays responsive while the model generates, and Ctrl-C
+        abandons this reply instead of exiting the TUI. The loop's own SIGINT
+        handling is swapped out meanwhile, since asyncio.run counts interrupts
+        and would quit on the second one.
+        """
+        self.chat_history.append(("You", message))
+
+        speaker = self._new_speaker()
+        reply = _LiveReply(self.console, speaker)
+        loop = asyncio.get_running_loop()
+        previous = signal.getsignal(signal.SIGINT)
+        try:
+            loop.add_signal_handler(signal.SIGINT, asyncio.current_task().cancel)
+            own_sigint = True
+        except (NotImplementedError, RuntimeError):  # Windows, or not the main thread
+            own_sigint = False
+        try:
+            with reply:
+                response = await asyncio.to_thread(self.chat_assistant.chat, message, reply)
+        except asyncio.CancelledError:
+            asyncio.current_task().uncancel()
+            reply.cancel()
+            if speaker:
+                speaker.cancel()
+            self.chat_history.pop()
+            self.console.print("[yellow]Cancelled[/yellow]")
+            return
+        finally:
+            if own_sigint:
+                loop.remove_signal_handler(signal.SIGINT)
+                signal.signal(signal.SIGINT, previous)
+
+        self._show_response(response, speaker, shown=reply.started)
+
+    def _new_speaker(self) -> Optional["_SentenceSpeaker"]:
+        """A speaker for the next reply, or None if voice output is off."""
+        return _SentenceSpeaker(self._tts_worker) if self.tts_enabled else None
+
+    def _show_response(self, response: str, speaker: Optional["_SentenceSpeaker"] = None, shown: bool = False):
+        """Record an assistant reply, display it unless it streamed, and wait for it to be spoken."""
         # Add response to history
-        self.chat_history.append(f"LTL: {response}")
+        self.chat_history.append(("LTL", response))
 
         # Display response
-        response_panel = Panel(response, title="🤖 LTL", border_style="green")
-        self.console.print(response_panel)
+        if not shown:
+            self.console.print(_reply_panel(Text(response)))
 
-        # Voice output if available
-        if self.tts_enabled:
+        # Speech started while the reply streamed; let the rest play out
+        if speaker:
             try:
                 with self.console.status("[magenta]Speaking...", spinner="dots"):
-                    self._speak_text(response)
+                    speaker.close()
             except Exception as e:
                 self.console.print(f"[yellow]Voice output failed: {e}[/yellow]")
 
-    def _speak_text(self, text: str):
-        """Speak text using TTS in venv."""
-        try:
-            import subprocess
-            import tempfile
-            import os
+    @functools.cached_property
+    def _tts_worker(self):
+        """Persistent TTS process in .venv311 (started on the first reply spoken).
 
-            # Create TTS script
-            tts_script = f'''
-import sys
-sys.path.insert(0, '.')
-from tts import TextToSpeechService
-import sounddevice as sd
-
-tts = TextToSpeechService()
-sample_rate, audio = tts.long_form_synthesize("""{text.replace('"', '\\"')}""")
-sd.play(audio, sample_rate)
-sd.wait()
-print("TTS_COMPLETE")
-'''
-
-            # Write script to temp file
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-                f.write(tts_script)
-                script_path = f.name
+        Piper stays on the CPU unless tools.voice.tts_cuda is set, so it doesn't
+        hold VRAM next to the Ollama model for the whole session.
+        """
+        from ltl.core.tts_worker import TTSWorker
 
-            try:
-                # Run TTS in venv
-                venv_python = os.path.join(
-                    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                    ".venv311",
-                    "bin",
-                    "python3",
-                )
-                result = subprocess.run(
-                    [venv_python, script_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                )
-
-                if result.returncode != 0:
-                    raise Exception(f"TTS failed: {result.stderr}")
-
-            finally:
-                # Clean up temp file
-                try:
-                    os.unlink(script_path)
-                except:
-                    pass
+        use_cuda = bool(self.config.get("tools", {}).get("voice", {}).get("tts_cuda", False))
+        return TTSWorker(os.path.join(_TTS_VENV, "bin", "python3"), cwd=_REPO_ROOT, use_cuda=use_cuda)
 
-        except Exception as e:
-            raise Exception(f"Voice output failed: {e}")
-
-    def _play_audio(self, sample_rate: int, audio_array):
-        """Play audio using sounddevice."""
-        try:
-            import sounddevice as sd
-
-            sd.play(audio_array, sample_rate)
-            sd.wait()
-        except ImportError:
-            self.console.print("[yellow]Audio playback not available[/yellow]")
-        except Exception as e:
-            self.console.print(f"[yellow]Audio playback failed: {e}[/yellow]")
-
-    def show_tools(self):
-        """Show available tools."""
+    @functools.cached_property
+    def _registry(self):
+        """The global tool registry, with the built-in tools registered once."""
         from ltl.core.tools import get_registry
         from ltl.tools import register_builtin_tools
 
         registry = get_registry()
         register_builtin_tools(registry)
+        return registry
 
-        tools_panel = Panel(
+    @functools.cached_property
+    def _tools_panel(self) -> Panel:
+        registry = self._registry
+        return Panel(
             "Available Tools:\n\n"
             + "\n".join([f"  • {name}: {registry.get(name).description()}" for name in registry.list_tools()])
             + '\n\nTo execute a tool: /tool <name> [args]\nExample: /tool web_search query="python"',
             title="🔧 Tools",
             border_style="yellow",
         )
-        self.console.print(tools_panel)
+
+    def show_tools(self):
+        """Show available tools."""
+        self.console.print(self._tools_panel)
+
+    def _cmd_tool_reload(self):
+        # The tools panel is rendered once; re-register and render it again
+        from ltl.tools import register_builtin_tools
+
+        register_builtin_tools(self._registry)
+        self.__dict__.pop("_tools_panel", None)
+        self.console.print(f"[green]🔄 {len(self._registry.list_tools())} tools registered[/green]")
 
     def execute_tool_command(self, command: str):
         """Execute a tool command like /tool web_search query="test"."""
         try:
-            parts = command.split()
+            from ltl.commands.tool import parse_tool_kwargs
+
+            # shlex keeps quoted values like query="python packaging" together
+            parts = shlex.split(command)
             if len(parts) < 2:
                 self.console.print("[red]Usage: /tool <tool_name> [args][/red]")
                 return
 
-            tool_name = parts[1]
-            args = parts[2:] if len(parts) > 2 else []
-
-            # Parse key=value args
-            kwargs = {}
-            for arg in args:
-                if "=" in arg:
-                    key, value = arg.split("=", 1)
-                    # Try to convert to appropriate type
-                    try:
-                        if value.isdigit():
-                            kwargs[key] = int(value)
-                        elif value.lower() in ["true", "false"]:
-                            kwargs[key] = value.lower() == "true"
-                        else:
-                            kwargs[key] = value
-                    except:
-                        kwargs[key] = value
+            tool_name = parts[1].lower()
 
-            # Execute tool
-            from ltl.core.tools import execute_tool
-
-            result = execute_tool(tool_name, **kwargs)
+            result = self._registry.execute(tool_name, **parse_tool_kwargs(parts[2:]))
 
             if result.success:
                 result_panel = Panel(result.data, title=f"✅ {tool_name}", border_style="green")
@@ -508,9 +590,6 @@ print("TTS_COMPLETE")
     def start_gateway(self):
         """Start the gateway."""
         try:
-            from ltl.commands.gateway import run as gateway_run
-            import argparse
-
             args = argparse.Namespace()
             self.console.print("[blue]🚀 Starting gateway...[/blue]")
             gateway_run(args)
@@ -524,19 +603,26 @@ print("TTS_COMPLETE")
         show_config()
 
     def _check_ollama(self) -> bool:
-        """Check if Ollama is running."""
+        """Check if Ollama is running (probed at most every _OLLAMA_CHECK_TTL seconds).
+
+        A TCP connect to the configured host is enough to tell whether the
+        server is up, so this doesn't fetch and decode /api/tags.
+        """
+        checked_at, ok = self._ollama_cache
+        now = time.monotonic()
+        if now - checked_at < _OLLAMA_CHECK_TTL:
+            return ok
         try:
-            import requests
-
-            ollama_config = self.config.get("providers", {}).get("ollama", {})
-            base_url = ollama_config.get("base_url", "http://localhost:11434")
-            response = requests.get(f"{base_url}/api/tags", timeout=2)
-            return response.status_code == 200
-        except:
-            return False
-
-    def _get_channel_status(self) -> str:
-        """Get channel status."""
+            with socket.create_connection(self._ollama_address, timeout=0.5):
+                ok = True
+        except OSError:
+            ok = False
+        self._ollama_cache = (now, ok)
+        return ok
+
+    @functools.cached_property
+    def _channel_status(self) -> str:
+        """Enabled channels from self.config (loaded once, so computed once)."""
         channels = self.config.get("channels", {})
         enabled = []
         if channels.get("telegram", {}).get("enabled"):
@@ -547,32 +633,67 @@ print("TTS_COMPLETE")
 
     def run(self):
         """Run the TUI."""
+        try:
+            from prompt_toolkit import PromptSession
+        except ImportError:
+            PromptSession = None
+
         self.running = True
         self.show_welcome()
 
         try:
-            while self.running:
-                # Get user input
-                try:
-                    user_input = input("\n🎙️ You: ").strip()
-                except (EOFError, KeyboardInterrupt):
-                    break
-
-                if not user_input:
-                    continue
-
-                # Handle commands or chat
-                if user_input.startswith("/"):
-                    if self.handle_command(user_input):
+            if PromptSession is not None:
+                _use_uvloop()
+                asyncio.run(self.run_async(PromptSession()))
+            else:
+                while self.running:
+                    try:
+                        user_input = input(_PROMPT)
+                    except (EOFError, KeyboardInterrupt):
+                        break
+                    if self._handle_input(user_input):
                         break
-                else:
-                    self.handle_chat(user_input)
-
         except KeyboardInterrupt:
             pass
 
+        for worker in ("_tts_worker", "_asr_worker"):
+            if worker in self.__dict__:
+                self.__dict__[worker].close()
         self.console.print("\n👋 Goodbye! Thanks for using LTL.")
 
+    async def run_async(self, session):
+        """Input loop on an event loop, reading lines with prompt_toolkit.
+
+        While waiting for input the loop stays free for background tasks, and
+        anything the background gateway prints is drawn above the prompt
+        instead of through the line being typed.
+        """
+        from prompt_toolkit.patch_stdout import patch_stdout
+
+        while self.running:
+            try:
+                with patch_stdout(raw=True):
+                    user_input = (await session.prompt_async(_PROMPT)).strip()
+            except (EOFError, KeyboardInterrupt):
+                break
+            if not user_input:
+                continue
+            if user_input.startswith("/"):
+                if self.handle_command(user_input):
+                    break
+            else:
+                await self.handle_chat_async(user_input)
+
+    def _handle_input(self, user_input: str) -> bool:
+        """Handle one line of input. Returns True if should exit."""
+        user_input = user_input.strip()
+        if not user_input:
+            return False
+        if user_input.startswith("/"):
+            return self.handle_command(user_input)
+        self.handle_chat(user_input)
+        return False
+
 
 def run(args):
     """Run the TUI command."""
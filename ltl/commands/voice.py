@@ -3,13 +3,15 @@
 import os
 import sys
 
+# app_optimized.py at the repo root, resolved relative to this file
+_APP_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "app_optimized.py"
+)
+
 
 def run(args):
     """Run the voice assistant pipeline."""
-    # Resolve app_optimized.py relative to this file
-    base = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    script = os.path.join(base, "app_optimized.py")
-
+    script = _APP_SCRIPT
     if not os.path.exists(script):
         print(f"❌ Voice pipeline not found: {script}")
         return
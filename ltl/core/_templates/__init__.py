@@ -0,0 +1 @@
+"""Workspace template files copied by ltl.core.workspace.create_template_files."""
@@ -0,0 +1,170 @@
+"""Long-lived Whisper process for TUI voice input.
+
+Recording and transcription run in ~/whisper-env, where faster-whisper (or
+openai-whisper) and sounddevice are installed (see ltl.core.worker). The child
+loads the model in the background as soon as it starts and keeps it between
+recordings. Requests, one per line:
+
+    record  -> "RECORDING" once the microphone stream is open
+    stop    -> "TEXT <json string>", "NO_AUDIO" or "ERROR <message>"
+
+Capture stops by itself after MAX_SECONDS; "stop" is still needed to get the
+transcription.
+"""
+
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from ltl.core.worker import LineWorker
+
+MAX_SECONDS = 10
+_WHISPER_RATE = 16000
+
+
+class AsrWorker(LineWorker):
+    """Records and transcribes through the Whisper child process."""
+
+    module = "ltl.core.asr_worker"
+
+    def start_recording(self, timeout: float = 10.0) -> None:
+        """Open the microphone and start capturing."""
+        reply = self.request("record", timeout)
+        if reply != "RECORDING":
+            raise RuntimeError(reply.removeprefix("ERROR").strip() or reply)
+
+    def finish(self, timeout: float = 60.0) -> str:
+        """Stop capturing and return the transcription ("" if nothing was heard)."""
+        reply = self.request("stop", timeout)
+        if reply.startswith("TEXT "):
+            return json.loads(reply[len("TEXT ") :])
+        if reply == "NO_AUDIO":
+            return ""
+        raise RuntimeError(reply.removeprefix("ERROR").strip() or reply)
+
+
+def _load_transcriber() -> Callable:
+    """Load Whisper tiny and return a function from 16 kHz float32 audio to text."""
+    try:
+        # CTranslate2 int8 kernels; vad_filter skips the silent part of the buffer
+        from faster_whisper import WhisperModel
+    except ImportError:
+        import whisper
+
+        model = whisper.load_model("tiny")
+        return lambda audio: model.transcribe(audio, fp16=False)["text"].strip()
+
+    model = WhisperModel("tiny", device="cpu", compute_type="int8")
+    try:
+        # faster-whisper >= 1.1: decode the VAD-split windows in batches
+        from faster_whisper import BatchedInferencePipeline
+
+        pipeline = BatchedInferencePipeline(model=model)
+        options = {"batch_size": 8, "beam_size": 1, "vad_filter": True}
+    except ImportError:
+        pipeline = model
+        options = {"beam_size": 1, "vad_filter": True}
+
+    def transcribe(audio):
+        segments, _ = pipeline.transcribe(audio, **options)
+        return "".join(s.text for s in segments).strip()
+
+    return transcribe
+
+
+def _resample(np, audio, samplerate: int):
+    """Resample audio to the 16 kHz Whisper expects."""
+    if samplerate == _WHISPER_RATE:
+        return audio
+    try:
+        import soxr  # SIMD C resampler
+
+        return soxr.resample(audio, samplerate, _WHISPER_RATE, quality="QQ")
+    except ImportError:
+        pass
+    try:
+        from math import gcd
+
+        from scipy.signal import resample_poly
+
+        factor = gcd(samplerate, _WHISPER_RATE)
+        return resample_poly(audio, _WHISPER_RATE // factor, samplerate // factor).astype(np.float32, copy=False)
+    except ImportError:
+        # Last resort: linear interpolation (hurts accuracy; install soxr or scipy)
+        length_ratio = _WHISPER_RATE / samplerate
+        indices = np.arange(int(len(audio) * length_ratio)) / length_ratio
+        return np.interp(indices, np.arange(len(audio)), audio).astype(np.float32)
+
+
+def _input_samplerate(sd) -> int:
+    """Capture rate: 16 kHz if the microphone supports it (no resampling), else its native rate."""
+    try:
+        sd.check_input_settings(samplerate=_WHISPER_RATE, channels=1, dtype="float32")
+        return _WHISPER_RATE
+    except Exception:
+        pass
+    try:
+        device_info = sd.query_devices(sd.default.device[0], "input")
+        return int(device_info["default_samplerate"])
+    except Exception:
+        return 44100  # Common fallback
+
+
+def _serve() -> None:
+    """Child side: handle record/stop requests from stdin, reply on stdout."""
+    replies = sys.stdout
+    sys.stdout = sys.stderr  # keep library prints out of the reply stream
+
+    def reply(line: str) -> None:
+        replies.write(line + "\n")
+        replies.flush()
+
+    import numpy as np
+    import sounddevice as sd
+
+    # Load the model while the user is still talking
+    transcriber = ThreadPoolExecutor(max_workers=1).submit(_load_transcriber)
+
+    samplerate = _input_samplerate(sd)
+    max_samples = samplerate * MAX_SECONDS
+    recording = np.empty(max_samples, dtype=np.float32)
+    write_idx = 0
+
+    def callback(indata, frames, time_info, status):
+        # Copy straight into the preallocated buffer; audio past the cap is dropped
+        nonlocal write_idx
+        n = min(frames, max_samples - write_idx)
+        recording[write_idx : write_idx + n] = indata[:n, 0]
+        write_idx += n
+
+    for line in sys.stdin:
+        if line.strip() != "record":
+            reply(f"ERROR unexpected request {line.strip()!r}")
+            continue
+        write_idx = 0
+        try:
+            # 100 ms blocks keep the callback's per-call cost predictable
+            stream = sd.InputStream(
+                samplerate=samplerate, channels=1, dtype="float32", blocksize=samplerate // 10, callback=callback
+            )
+            with stream:
+                reply("RECORDING")
+                sys.stdin.readline()  # "stop"
+        except Exception as e:
+            reply(f"ERROR Recording failed: {e}".replace("\n", " "))
+            continue
+
+        if not write_idx:
+            reply("NO_AUDIO")
+            continue
+        try:
+            text = transcriber.result()(_resample(np, recording[:write_idx], samplerate))
+        except Exception as e:
+            reply(f"ERROR Transcription failed: {e}".replace("\n", " "))
+            continue
+        reply("TEXT " + json.dumps(text))
+
+
+if __name__ == "__main__":
+    _serve()
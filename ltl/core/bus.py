@@ -8,17 +8,27 @@ import asyncio
 import logging
 import threading
 import time
-from dataclasses import dataclass
-from typing import Optional, Callable
-from queue import Queue, Full
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import AsyncIterator, Optional, Callable, Mapping
+from collections import deque
+from queue import SimpleQueue
 
 log = logging.getLogger(__name__)
 
 _INBOUND_MAXSIZE = 500
 _OUTBOUND_MAXSIZE = 200
+# Outbound messages handed to one channel's handler per dispatcher wakeup
+_DISPATCH_BATCH = 64
 
+# Returned by get_metadata() for messages without metadata, instead of a dict each
+_EMPTY_METADATA = MappingProxyType({})
 
-@dataclass
+# Wakes the outbound dispatcher when the bus stops
+_SHUTDOWN = object()
+
+
+@dataclass(slots=True)
 class InboundMessage:
     """Message from a channel to the assistant."""
 
@@ -27,31 +37,29 @@ class InboundMessage:
     chat_id: str  # Chat/conversation identifier
     content: str  # Message content
     session_key: str  # Session identifier for conversation history
-    timestamp: float  # Unix timestamp
-    metadata: dict = None  # Additional channel-specific data
+    # Monotonic, for ordering within the bus; put wall-clock time in metadata["wall_ts"] if needed
+    timestamp: float = field(default_factory=time.monotonic)
+    metadata: Optional[dict] = None  # Additional channel-specific data
 
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
-        if self.timestamp == 0:
-            self.timestamp = time.time()
+    def get_metadata(self) -> Mapping:
+        """Channel-specific data; a shared empty mapping when none was given."""
+        return self.metadata or _EMPTY_METADATA
 
 
-@dataclass
+@dataclass(slots=True)
 class OutboundMessage:
     """Message from assistant to a channel."""
 
     channel: str  # Target channel
     chat_id: str  # Target chat/conversation
     content: str  # Message content
-    timestamp: float  # Unix timestamp
-    metadata: dict = None  # Additional channel-specific data
+    # Monotonic, for ordering within the bus; put wall-clock time in metadata["wall_ts"] if needed
+    timestamp: float = field(default_factory=time.monotonic)
+    metadata: Optional[dict] = None  # Additional channel-specific data
 
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
-        if self.timestamp == 0:
-            self.timestamp = time.time()
+    def get_metadata(self) -> Mapping:
+        """Channel-specific data; a shared empty mapping when none was given."""
+        return self.metadata or _EMPTY_METADATA
 
 
 class MessageBus:
@@ -61,9 +69,18 @@ class MessageBus:
     Similar to PicoClaw's bus system but simplified for LTL.
     """
 
-    def __init__(self):
-        self.inbound_queue = Queue(maxsize=_INBOUND_MAXSIZE)
-        self.outbound_queues: dict[str, Queue] = {}
+    def __init__(self, max_inbound: int = _INBOUND_MAXSIZE):
+        # Single consumer, so a bounded deque (oldest dropped when full) plus an
+        # Event for wakeups replaces a Queue and its per-operation condvar
+        self.inbound_queue: deque[InboundMessage] = deque(maxlen=max_inbound)
+        self._inbound_ready = threading.Event()
+        # Set while aiter_inbound runs: wakes its event loop from any thread
+        self._async_wakeup: Optional[Callable[[], None]] = None
+        self._stopped = False
+        # Per-channel outbound deques; _dispatch is their only consumer
+        self.outbound_queues: dict[str, deque[OutboundMessage]] = {}
+        # Names of channels with newly queued outbound messages, for _run
+        self._ready: SimpleQueue = SimpleQueue()
         self._handler_lock = threading.RLock()
         self._channel_handlers: dict[str, Callable] = {}
         self.running = False
@@ -75,87 +92,184 @@ class MessageBus:
             return
 
         self.running = True
+        self._stopped = False
         self.thread = threading.Thread(target=self._run, daemon=True)
         self.thread.start()
 
     def stop(self):
         """Stop the message bus."""
         self.running = False
+        if self.thread and self.thread.is_alive():
+            self._ready.put(_SHUTDOWN)
+        self._stopped = True
+        self._inbound_ready.set()
+        self._wake_async()
         if self.thread:
             self.thread.join(timeout=5)
 
     def _run(self):
-        """Main bus processing loop."""
+        """Main bus processing loop.
+
+        Blocks until a publish names a channel with pending outbound messages,
+        so an idle bus never wakes up.
+        """
         while self.running:
+            # No timeout: stop() wakes this with _SHUTDOWN
+            channel = self._ready.get()
+            if channel is _SHUTDOWN:
+                break
+            self._dispatch(channel)
+
+    def _dispatch(self, channel: str):
+        """Hand up to _DISPATCH_BATCH queued outbound messages for channel to its handler.
+
+        If more are left the channel goes back on the ready queue, so one busy
+        channel can't starve the others.
+        """
+        queue = self.outbound_queues.get(channel)
+        if queue is None:
+            return
+        with self._handler_lock:
+            handler = self._channel_handlers.get(channel)
+        for _ in range(_DISPATCH_BATCH):
             try:
-                # Process outbound messages
-                for channel, queue in list(self.outbound_queues.items()):
-                    try:
-                        while not queue.empty():
-                            msg = queue.get_nowait()
-                            with self._handler_lock:
-                                handler = self._channel_handlers.get(channel)
-                            if handler:
-                                try:
-                                    handler(msg)
-                                except Exception as he:
-                                    log.error("Handler error for %s: %s", channel, he)
-                            else:
-                                log.debug("Outbound to %s:%s (no handler)", channel, msg.chat_id)
-                    except Exception as e:
-                        print(f"[BUS] Error processing outbound for {channel}: {e}")
-
-                time.sleep(0.1)  # Small delay to prevent busy waiting
-
-            except Exception as e:
-                print(f"[BUS] Error in main loop: {e}")
-                time.sleep(1)
+                msg = queue.popleft()
+            except IndexError:
+                return
+            if handler:
+                try:
+                    handler(msg)
+                except Exception as he:
+                    log.error("Handler error for %s: %s", channel, he)
+            else:
+                log.debug("Outbound to %s:%s (no handler)", channel, msg.chat_id)
+        if queue:
+            self._ready.put(channel)
 
     def publish_inbound(self, message: InboundMessage):
-        """Publish an inbound message to the assistant."""
+        """Publish an inbound message to the assistant.
+
+        When the queue is full the oldest waiting message is dropped, so a
+        burst of spam costs stale messages rather than the newest ones.
+        """
+        if len(self.inbound_queue) == self.inbound_queue.maxlen:
+            try:
+                log.warning("Inbound queue full — dropping oldest message from %s", self.inbound_queue[0].sender_id)
+            except IndexError:
+                pass  # the consumer just made room
+        self.inbound_queue.append(message)
+        self._inbound_ready.set()
+        self._wake_async()
+
+    def _wake_async(self):
+        wakeup = self._async_wakeup
+        if wakeup is None:
+            return
         try:
-            self.inbound_queue.put_nowait(message)
-        except Full:
-            log.warning("Inbound queue full — dropping message from %s", message.sender_id)
+            wakeup()
+        except RuntimeError:
+            pass  # the consumer's event loop has closed
+
+    def pressure(self) -> float:
+        """Fraction of the inbound queue in use (0.0 empty, 1.0 full)."""
+        return len(self.inbound_queue) / self.inbound_queue.maxlen
 
     def consume_inbound(self, timeout: float = None) -> Optional[InboundMessage]:
-        """Consume an inbound message (blocking)."""
+        """Consume an inbound message (blocking).
+
+        With ``timeout=None`` this blocks until a message arrives or the bus is
+        stopped. Returns None on timeout or shutdown.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self.inbound_queue.popleft()
+            except IndexError:
+                pass
+            if self._stopped:
+                return None
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            if self._inbound_ready.wait(remaining):
+                # Cleared before re-checking the deque, so a publish after
+                # the failed popleft() above is never missed
+                self._inbound_ready.clear()
+
+    async def aiter_inbound(self) -> AsyncIterator[InboundMessage]:
+        """Yield inbound messages on the running event loop until the bus stops.
+
+        Publishers wake the loop with call_soon_threadsafe, so the consumer
+        awaits an asyncio.Event instead of a thread blocking on the queue.
+        """
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        self._async_wakeup = lambda: loop.call_soon_threadsafe(ready.set)
         try:
-            if timeout:
-                return self.inbound_queue.get(timeout=timeout)
-            else:
-                return self.inbound_queue.get(block=False)
-        except:
-            return None
+            while True:
+                try:
+                    yield self.inbound_queue.popleft()
+                    continue
+                except IndexError:
+                    pass
+                if self._stopped or not self.running:
+                    return
+                ready.clear()
+                # Re-checked after clear(), so a publish in between isn't missed
+                if not self.inbound_queue:
+                    await ready.wait()
+        finally:
+            self._async_wakeup = None
 
     def publish_outbound(self, message: OutboundMessage):
         """Publish an outbound message to a channel."""
-        if message.channel not in self.outbound_queues:
-            self.outbound_queues[message.channel] = Queue(maxsize=_OUTBOUND_MAXSIZE)
-        try:
-            self.outbound_queues[message.channel].put_nowait(message)
-        except Full:
+        queue = self.get_channel_queue(message.channel)
+        if len(queue) >= _OUTBOUND_MAXSIZE:
             log.warning("Outbound queue full for channel %s — dropping reply", message.channel)
+            return
+        queue.append(message)
+        self._ready.put(message.channel)
+
+    def publish_outbound_batch(self, messages: list[OutboundMessage]):
+        """Publish several outbound messages, looking up each channel queue once."""
+        by_channel: dict[str, list[OutboundMessage]] = {}
+        for message in messages:
+            by_channel.setdefault(message.channel, []).append(message)
+        for channel, batch in by_channel.items():
+            queue = self.get_channel_queue(channel)
+            room = max(_OUTBOUND_MAXSIZE - len(queue), 0)
+            if len(batch) > room:
+                log.warning("Outbound queue full for channel %s — dropping %d replies", channel, len(batch) - room)
+                batch = batch[:room]
+            queue.extend(batch)
+            self._ready.put(channel)
 
     def register_channel_handler(self, channel: str, handler: Callable[[OutboundMessage], None]):
         """Register a handler for outbound messages to a specific channel."""
         with self._handler_lock:
             self._channel_handlers[channel] = handler
 
-    def get_channel_queue(self, channel: str) -> Queue:
+    def get_channel_queue(self, channel: str) -> deque[OutboundMessage]:
         """Get the outbound queue for a channel."""
-        if channel not in self.outbound_queues:
-            self.outbound_queues[channel] = Queue()
-        return self.outbound_queues[channel]
+        queue = self.outbound_queues.get(channel)
+        if queue is None:
+            queue = self.outbound_queues.setdefault(channel, deque())
+        return queue
 
 
-# Global message bus instance
+# Global message bus instance; created on first get_bus() so the gateway's
+# configured queue size applies
 _bus = None
+_bus_lock = threading.Lock()
 
 
-def get_bus() -> MessageBus:
-    """Get the global message bus."""
+def get_bus(max_inbound: Optional[int] = None) -> MessageBus:
+    """Get the global message bus (max_inbound only applies when it is created)."""
     global _bus
-    if _bus is None:
-        _bus = MessageBus()
-    return _bus
+    bus = _bus
+    if bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = MessageBus(max_inbound or _INBOUND_MAXSIZE)
+            bus = _bus
+    return bus
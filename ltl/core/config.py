@@ -1,9 +1,11 @@
 """Configuration management for LTL."""
 
 import os
-import json
+import re
 from pathlib import Path
 
+import orjson
+
 
 LTL_DIR = os.path.expanduser("~/.ltl")
 CONFIG_PATH = os.path.join(LTL_DIR, "config.json")
@@ -19,18 +21,30 @@ _ENV_MAP = {
 }
 
 
-def _load_env_overrides(config: dict) -> dict:
-    """Load API keys from ~/.ltl/.env and overlay onto config."""
-    env_vars = {}
+# KEY=value lines of ~/.ltl/.env; comments and malformed lines don't match
+_ENV_LINE_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=(.*)$", re.MULTILINE)
+
+# (stamp, parsed variables) from the last read of ENV_PATH
+_env_file_cache: tuple | None = None
 
-    # Load from .env file if it exists
-    if os.path.exists(ENV_PATH):
+
+def _read_env_file(stamp) -> dict:
+    """Variables from ~/.ltl/.env, re-parsed only when its stat stamp changes."""
+    global _env_file_cache
+    if _env_file_cache is not None and _env_file_cache[0] == stamp:
+        return _env_file_cache[1]
+    env_vars = {}
+    if stamp is not None:
         with open(ENV_PATH) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, _, val = line.partition("=")
-                    env_vars[key.strip()] = val.strip().strip('"').strip("'")
+            for key, val in _ENV_LINE_RE.findall(f.read()):
+                env_vars[key] = val.strip().strip('"').strip("'")
+    _env_file_cache = (stamp, env_vars)
+    return env_vars
+
+
+def _load_env_overrides(config: dict, env_stamp) -> dict:
+    """Load API keys from ~/.ltl/.env and overlay onto config."""
+    env_vars = dict(_read_env_file(env_stamp))
 
     # Also check actual environment variables (these take priority)
     for key in _ENV_MAP:
@@ -54,24 +68,77 @@ def get_config_path():
     return CONFIG_PATH
 
 
-def load_config():
-    """Load configuration from file, overlaying keys from ~/.ltl/.env."""
-    if not os.path.exists(CONFIG_PATH):
-        config = get_default_config()
-    else:
-        with open(CONFIG_PATH, "r") as f:
-            config = json.load(f)
+# (stamp, orjson-encoded config) from the last load_config() call
+_cache: tuple | None = None
+
 
-    return _load_env_overrides(config)
+def _config_stamp() -> tuple:
+    """Cheap change marker for everything load_config() reads."""
+    stamp = []
+    for path in (CONFIG_PATH, ENV_PATH):
+        try:
+            st = os.stat(path)
+            stamp.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamp.append(None)
+    stamp.append(tuple(os.environ.get(key) for key in _ENV_MAP))
+    return tuple(stamp)
+
+
+def load_config():
+    """Load configuration from file, overlaying keys from ~/.ltl/.env.
+
+    The result is reused until config.json, .env or the API-key environment
+    variables change; every caller gets its own copy to modify.
+    """
+    global _cache
+    stamp = _config_stamp()
+    if _cache is None or _cache[0] != stamp:
+        if stamp[0] is None:
+            config = get_default_config()
+        else:
+            with open(CONFIG_PATH, "rb") as f:
+                config = orjson.loads(f.read())
+        _cache = (stamp, orjson.dumps(_load_env_overrides(config, stamp[1])))
+    return orjson.loads(_cache[1])
+
+
+def load_raw_config():
+    """Load config.json as saved, without the .env overlay (defaults if missing).
+
+    For read-modify-write callers, so keys from .env aren't written back into
+    config.json by save_config().
+    """
+    try:
+        with open(CONFIG_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return get_default_config()
 
 
 def save_config(config):
     """Save configuration to file (owner-only permissions)."""
+    global _cache
     os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
 
-    with open(CONFIG_PATH, "w") as f:
-        json.dump(config, f, indent=2)
-    os.chmod(CONFIG_PATH, 0o600)
+    # Write a temp file and rename it over config.json, so readers never
+    # see a half-written file and a failed write keeps the old one
+    tmp_path = CONFIG_PATH + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o600)  # in case a stale temp file had other permissions
+        os.replace(tmp_path, CONFIG_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    _cache = None
 
 
 def create_default_config():
@@ -109,7 +176,12 @@ def get_default_config():
         },
         "tools": {
             "web": {"search": {"enabled": True, "max_results": 5}},
-            "voice": {"enabled": True, "whisper_model": "base.en", "piper_voice": "en_US-lessac-medium"},
+            "voice": {
+                "enabled": True,
+                "whisper_model": "base.en",
+                "piper_voice": "en_US-lessac-medium",
+                "tts_cuda": False,  # Piper on the GPU; the CPU keeps VRAM for the LLM
+            },
             "vision": {"enabled": True, "model": "moondream"},
         },
         "gateway": {"host": "0.0.0.0", "port": 18790},
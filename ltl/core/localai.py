@@ -4,30 +4,60 @@ LocalAI is an open-source drop-in replacement for OpenAI API that runs locally.
 Provides better performance and more control than Ollama for complex tasks.
 """
 
-import os
-import sys
-import json
-import requests
-from typing import Dict, Any, Optional
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import time
+import orjson
+from importlib.util import find_spec
+from typing import Dict, Any, Iterator, Optional
 
 from ltl.core.config import load_config
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Retries while LocalAI is (re)loading a model and answers 502/503; a 502/503
+# means the request wasn't served, so POSTs are retried too
+_RETRY_STATUSES = (502, 503)
+_RETRIES = 2
+_RETRY_BACKOFF = 0.1  # seconds, doubled per attempt
+
+
+def _http2_available() -> bool:
+    """httpx speaks HTTP/2 only with the optional h2 package installed."""
+    return find_spec("h2") is not None
+
 
 class LocalAIProvider:
     """LocalAI provider for local LLM inference."""
 
     def __init__(self, base_url: str = "http://localhost:8080"):
+        # httpx is imported here and in the methods below, so importing this
+        # module (e.g. for update_config_for_localai) stays cheap
+        import httpx
+
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.timeout = 120  # Longer timeout for local inference
+        # One keep-alive pool; over HTTP/2 concurrent chats share a connection
+        self.client = httpx.Client(
+            timeout=120.0,  # Longer timeout for local inference
+            limits=httpx.Limits(max_keepalive_connections=32),
+            transport=httpx.HTTPTransport(http2=_http2_available(), retries=2),  # connection errors only
+        )
+
+    def _post_json(self, path: str, payload: dict, stream: bool = False):
+        """POST payload, retrying briefly while LocalAI answers 502/503 (e.g. loading a model)."""
+        request = self.client.build_request(
+            "POST", f"{self.base_url}{path}", content=orjson.dumps(payload), headers=_JSON_HEADERS
+        )
+        for attempt in range(_RETRIES + 1):
+            response = self.client.send(request, stream=stream)
+            if response.status_code not in _RETRY_STATUSES or attempt == _RETRIES:
+                return response
+            response.close()
+            time.sleep(_RETRY_BACKOFF * 2**attempt)
 
     def chat_completion(
         self, messages: list, model: str = "gpt-3.5-turbo", temperature: float = 0.7, max_tokens: int = 1024
     ) -> Dict[str, Any]:
         """Make a chat completion request to LocalAI."""
-        url = f"{self.base_url}/v1/chat/completions"
+        import httpx
 
         payload = {
             "model": model,
@@ -38,28 +68,65 @@ class LocalAIProvider:
         }
 
         try:
-            response = self.session.post(url, json=payload)
+            response = self._post_json("/v1/chat/completions", payload)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except httpx.HTTPError as e:
+            raise Exception(f"LocalAI request failed: {e}")
+
+    def chat_completion_stream(
+        self, messages: list, model: str = "gpt-3.5-turbo", temperature: float = 0.7, max_tokens: int = 1024
+    ) -> Iterator[str]:
+        """Stream a chat completion from LocalAI, yielding content pieces as they arrive."""
+        import httpx
+
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+
+        try:
+            response = self._post_json("/v1/chat/completions", payload, stream=True)
+            try:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    # Server-sent events: "data: {...}" lines, ending with "data: [DONE]"
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        choices = orjson.loads(data).get("choices") or [{}]
+                    except orjson.JSONDecodeError:
+                        continue
+                    delta = choices[0].get("delta", {}).get("content")
+                    if delta:
+                        yield delta
+            finally:
+                response.close()
+        except httpx.HTTPError as e:
             raise Exception(f"LocalAI request failed: {e}")
 
     def list_models(self) -> list:
         """List available models in LocalAI."""
-        url = f"{self.base_url}/v1/models"
+        import httpx
 
         try:
-            response = self.session.get(url)
+            response = self.client.get(f"{self.base_url}/v1/models")
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return [model["id"] for model in data.get("data", [])]
-        except requests.exceptions.RequestException:
+        except (httpx.HTTPError, orjson.JSONDecodeError):
             return []
 
     def is_available(self) -> bool:
         """Check if LocalAI is running and accessible."""
         try:
-            response = self.session.get(f"{self.base_url}/health", timeout=5)
+            response = self.client.get(f"{self.base_url}/health", timeout=5)
             return response.status_code == 200
         except:
             return False
@@ -84,6 +151,37 @@ def create_localai_provider(config: dict) -> Optional[LocalAIProvider]:
     return provider
 
 
+# Seconds a LocalAI health check is trusted by get_localai_response()
+_HEALTH_TTL = 30.0
+
+# (provider, monotonic time of its last health check, available)
+_provider_cache: tuple | None = None
+
+
+def _get_cached_provider(config: dict) -> Optional[LocalAIProvider]:
+    """Reuse one provider (and its session) across calls, re-probing /health every _HEALTH_TTL s."""
+    global _provider_cache
+    localai_config = config.get("providers", {}).get("localai", {})
+    if not localai_config.get("enabled", False):
+        return None
+    base_url = localai_config.get("base_url", "http://localhost:8080").rstrip("/")
+
+    now = time.monotonic()
+    if _provider_cache is not None and _provider_cache[0].base_url == base_url:
+        provider, checked_at, available = _provider_cache
+        if now - checked_at < _HEALTH_TTL:
+            return provider if available else None
+    else:
+        if _provider_cache is not None:
+            _provider_cache[0].client.close()  # base_url changed
+        provider = LocalAIProvider(base_url)
+
+    # Cached either way, so a LocalAI that is down isn't re-probed every call
+    available = provider.is_available()
+    _provider_cache = (provider, now, available)
+    return provider if available else None
+
+
 def get_localai_response(message: str, config: dict = None) -> Optional[str]:
     """Get response from LocalAI for a simple message."""
     if config is None:
@@ -92,7 +190,7 @@ def get_localai_response(message: str, config: dict = None) -> Optional[str]:
         except:
             return None
 
-    provider = create_localai_provider(config)
+    provider = _get_cached_provider(config)
     if not provider:
         return None
 
@@ -0,0 +1,100 @@
+"""Similarity-keyed reply cache for the gateway.
+
+Chat prompts that mean the same thing ("hi" / "hello there") reuse an earlier
+reply when their embeddings are close enough. Embeds with sentence-transformers
+(all-MiniLM-L6-v2 on CPU, loaded on first use); if that isn't installed the
+cache disables itself and every lookup misses.
+
+Enable in ~/.ltl/config.json:
+    "cache": {"semantic": {"enabled": true, "threshold": 0.92, "max_entries": 256}}
+"""
+
+import functools
+import logging
+import threading
+from collections import deque
+from typing import Hashable, Optional
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+_DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+
+class SemanticCache:
+    """Bounded store of (embedding, reply) pairs, searched by cosine similarity.
+
+    Entries are partitioned by a caller-supplied scope (e.g. the model
+    generation) so a reply from one model is never served for another.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 256, model_name: str = _DEFAULT_MODEL):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._model_name = model_name
+        self._model = None
+        self._disabled = False
+        self._scopes: dict[Hashable, deque[tuple[np.ndarray, str]]] = {}
+        self._lock = threading.Lock()
+        # lookup() and the insert() that follows a miss embed the same text
+        self._embed = functools.lru_cache(maxsize=128)(self._encode)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: dict) -> Optional["SemanticCache"]:
+        """Build from config["cache"]["semantic"], or return None if disabled."""
+        sem_cfg = config.get("cache", {}).get("semantic", {})
+        if not sem_cfg.get("enabled", False):
+            return None
+        return cls(
+            threshold=sem_cfg.get("threshold", 0.92),
+            max_entries=sem_cfg.get("max_entries", 256),
+            model_name=sem_cfg.get("model", _DEFAULT_MODEL),
+        )
+
+    def lookup(self, scope: Hashable, text: str) -> Optional[str]:
+        """Return the reply of the most similar cached prompt, if similar enough."""
+        vec = self._embed(text)
+        if vec is None:
+            return None
+        with self._lock:
+            entries = self._scopes.get(scope)
+            if not entries:
+                self.misses += 1
+                return None
+            vectors = np.stack([v for v, _ in entries])
+            scores = vectors @ vec
+            best = int(scores.argmax())
+            if scores[best] < self.threshold:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entries[best][1]
+
+    def insert(self, scope: Hashable, text: str, reply: str) -> None:
+        """Remember reply for text, dropping the oldest entry in scope when full."""
+        vec = self._embed(text)
+        if vec is None:
+            return
+        with self._lock:
+            entries = self._scopes.get(scope)
+            if entries is None:
+                entries = self._scopes[scope] = deque(maxlen=self.max_entries)
+            entries.append((vec, reply))
+
+    def _encode(self, text: str) -> Optional[np.ndarray]:
+        """Unit-length embedding of text, or None if no model is available."""
+        if self._disabled:
+            return None
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+
+                self._model = SentenceTransformer(self._model_name, device="cpu")
+            except Exception as e:
+                log.warning("Semantic cache disabled: %s", e)
+                self._disabled = True
+                return None
+        return self._model.encode(text, normalize_embeddings=True)
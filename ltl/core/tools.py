@@ -76,19 +76,28 @@ class Tool(ABC):
             "parameters": {"type": "object", "properties": properties, "required": required},
         }
 
+    def _arg_names(self) -> tuple[tuple[str, ...], frozenset, frozenset]:
+        """(required names in order, required set, allowed set), built once per tool."""
+        names = getattr(self, "_arg_names_cache", None)
+        if names is None:
+            params = self.parameters()
+            required = tuple(p.name for p in params if p.required)
+            names = self._arg_names_cache = (required, frozenset(required), frozenset(p.name for p in params))
+        return names
+
     def validate_args(self, args: Dict[str, Any]) -> tuple[bool, Optional[str]]:
         """Validate arguments against parameter definitions."""
-        params = {p.name: p for p in self.parameters()}
+        required, required_set, allowed = self._arg_names()
 
         # Check required parameters
-        for name, param in params.items():
-            if param.required and name not in args:
-                return False, f"Missing required parameter: {name}"
+        if not required_set <= args.keys():
+            name = next(n for n in required if n not in args)
+            return False, f"Missing required parameter: {name}"
 
         # Check for unknown parameters
-        for name in args.keys():
-            if name not in params:
-                return False, f"Unknown parameter: {name}"
+        if not args.keys() <= allowed:
+            name = next(n for n in args if n not in allowed)
+            return False, f"Unknown parameter: {name}"
 
         return True, None
 
@@ -102,15 +111,24 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: Dict[str, Tool] = {}
+        # Formatted help text; key None is get_all_help(). Cleared on (un)register.
+        self._help_cache: Dict[Optional[str], str] = {}
+        # get_all_schemas() result; tool schemas don't change once registered
+        self._schemas: Optional[List[Dict[str, Any]]] = None
 
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name()] = tool
+        tool._arg_names()  # parameter sets for validate_args, built up front
+        self._help_cache.clear()
+        self._schemas = None
 
     def unregister(self, name: str) -> None:
         """Unregister a tool."""
         if name in self._tools:
             del self._tools[name]
+            self._help_cache.clear()
+            self._schemas = None
 
     def get(self, name: str) -> Optional[Tool]:
         """Get a tool by name."""
@@ -121,8 +139,14 @@ class ToolRegistry:
         return list(self._tools.keys())
 
     def get_all_schemas(self) -> List[Dict[str, Any]]:
-        """Get schemas for all registered tools."""
-        return [tool.get_schema() for tool in self._tools.values()]
+        """Get schemas for all registered tools.
+
+        Built once per set of registered tools; the schema dicts are shared,
+        so callers must not modify them.
+        """
+        if self._schemas is None:
+            self._schemas = [tool.get_schema() for tool in self._tools.values()]
+        return list(self._schemas)
 
     def execute(self, name: str, **kwargs) -> ToolResult:
         """Execute a tool by name."""
@@ -143,6 +167,9 @@ class ToolRegistry:
 
     def get_tool_help(self, name: str) -> str:
         """Get help text for a tool."""
+        if name in self._help_cache:
+            return self._help_cache[name]
+
         tool = self.get(name)
         if not tool:
             return f"Tool not found: {name}"
@@ -160,10 +187,14 @@ class ToolRegistry:
             lines.append(f"  --{param.name} <{param.type}> {req}{default}")
             lines.append(f"    {param.description}")
 
-        return "\n".join(lines)
+        text = self._help_cache[name] = "\n".join(lines)
+        return text
 
     def get_all_help(self) -> str:
         """Get help text for all tools."""
+        if None in self._help_cache:
+            return self._help_cache[None]
+
         lines = ["\nAvailable Tools:", "=" * 40, ""]
 
         for name in sorted(self.list_tools()):
@@ -173,18 +204,16 @@ class ToolRegistry:
                 lines.append(f"  {tool.description()}")
                 lines.append(f"  Usage: ltl tool {tool.name()} [args]")
 
-        return "\n".join(lines)
+        text = self._help_cache[None] = "\n".join(lines)
+        return text
 
 
-# Global registry instance
-_registry = None
+# Global registry instance (created at import, so there's no first-call race)
+_registry = ToolRegistry()
 
 
 def get_registry() -> ToolRegistry:
     """Get the global tool registry."""
-    global _registry
-    if _registry is None:
-        _registry = ToolRegistry()
     return _registry
 
 
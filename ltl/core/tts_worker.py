@@ -0,0 +1,63 @@
+"""Long-lived Piper TTS process for the TUI.
+
+The TTS stack (piper, sounddevice) lives in the repo's .venv311, so speech is
+produced by a child interpreter from that venv (see ltl.core.worker), run
+from the repo root so ``tts`` is importable. It loads
+TextToSpeechService once and takes one JSON-encoded line of text per
+utterance, answering "OK" or "ERROR <message>" once playback has finished.
+Piper runs on the CPU unless the child is started with --cuda.
+"""
+
+import json
+import re
+import sys
+from typing import Optional
+
+from ltl.core.worker import LineWorker
+
+# Split replies into sentences so the next one synthesizes while the last plays
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+class TTSWorker(LineWorker):
+    """Speaks text through the TTS child process."""
+
+    module = "ltl.core.tts_worker"
+
+    def __init__(self, python: str, cwd: Optional[str] = None, use_cuda: bool = False):
+        super().__init__(python, cwd, ["--cuda"] if use_cuda else [])
+
+    def speak(self, text: str, timeout: float = 60.0) -> None:
+        """Synthesize and play text, returning when playback has finished."""
+        reply = self.request(json.dumps(text), timeout)
+        if reply.startswith("ERROR"):
+            raise RuntimeError(reply[len("ERROR") :].strip())
+
+
+def _serve() -> None:
+    """Child side: speak each JSON line from stdin, reply on stdout."""
+    replies = sys.stdout
+    sys.stdout = sys.stderr  # keep library prints out of the reply stream
+
+    import sounddevice as sd
+    from tts import TextToSpeechService
+
+    tts = TextToSpeechService(use_cuda="--cuda" in sys.argv[1:])
+    for line in sys.stdin:
+        try:
+            text = json.loads(line)
+            for sentence in _SENTENCE_RE.split(text.strip()):
+                sample_rate, audio = tts.long_form_synthesize(sentence)
+                sd.wait()  # previous sentence finishes while this one was synthesized
+                if audio.size:
+                    sd.play(audio, sample_rate)
+            sd.wait()
+            replies.write("OK\n")
+        except Exception as e:
+            message = str(e).replace("\n", " ")
+            replies.write(f"ERROR {message}\n")
+        replies.flush()
+
+
+if __name__ == "__main__":
+    _serve()
@@ -1,59 +1,185 @@
 """Open-source voice transcription using Whisper.
 
-Uses openai-whisper (MIT licensed, free) for local speech-to-text.
+Uses faster-whisper (CTranslate2, int8 on CPU) when installed, otherwise
+openai-whisper (both MIT licensed, free) for local speech-to-text.
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import tempfile
-import numpy as np
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Greedy decoding for short voice messages: a single temperature (no fallback
+# re-decodes) and no conditioning on the previous window's text
+_DECODE_OPTIONS = {"temperature": 0.0, "condition_on_previous_text": False, "no_speech_threshold": 0.6}
+
+# webrtcvad frame length and mode (0-3, higher drops more non-speech)
+_VAD_FRAME_MS = 30
+_VAD_MODE = 2
+# Non-speech kept around each voiced frame, so word edges aren't clipped
+_VAD_PAD_MS = 200
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+def _trim_to_speech(pcm: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Drop the non-speech stretches of mono audio before it reaches Whisper.
+
+    pcm is int16 samples or floats in [-1, 1]; the result has the same dtype.
+
+    Frames webrtcvad marks as voiced are kept, with _VAD_PAD_MS on either
+    side. Returns an empty array if nothing is voiced, and the input
+    unchanged if webrtcvad is missing or can't handle the sample rate.
+    """
+    if sample_rate not in (8000, 16000, 32000, 48000):
+        return pcm
+    try:
+        import webrtcvad
+    except ImportError:
+        return pcm
+    import numpy as np
+
+    vad = webrtcvad.Vad(_VAD_MODE)
+    frame = sample_rate * _VAD_FRAME_MS // 1000
+    n_frames = len(pcm) // frame
+    if not n_frames:
+        return pcm
+    frames = pcm[: n_frames * frame].reshape(n_frames, frame)
+    if frames.dtype == np.int16:
+        to_bytes = np.ndarray.tobytes
+    else:
+        # webrtcvad takes 16-bit PCM; convert one frame at a time
+        def to_bytes(f):
+            return (f * 32767).astype(np.int16).tobytes()
+
+    voiced = np.fromiter((vad.is_speech(to_bytes(f), sample_rate) for f in frames), dtype=bool, count=n_frames)
+    if not voiced.any():
+        return pcm[:0]
+    if voiced.all():
+        return pcm
+
+    # Widen each voiced frame by the padding, then keep the covered frames
+    pad = _VAD_PAD_MS // _VAD_FRAME_MS
+    # ("full" and a slice: "same" returns the longer input's length, i.e. the
+    # kernel's for clips shorter than it)
+    window = np.ones(2 * pad + 1, dtype=np.int32)
+    keep = np.convolve(voiced.astype(np.int32), window, mode="full")[pad : pad + n_frames] > 0
+    return frames[keep].reshape(-1)
 
 
 class WhisperTranscriber:
     """Open-source voice transcription using Whisper."""
 
+    # site-packages of ~/whisper-env ("" if there is none), looked up once per process
+    _whisper_site_packages: Optional[str] = None
+
     def __init__(self, model_name: str = "tiny"):
         self.model_name = model_name
         self.model = None
+        self._faster = False  # faster-whisper (CTranslate2) rather than openai-whisper
+        self._fp32_buf: Optional[np.ndarray] = None  # reused across transcribe_audio calls
 
     def load_model(self):
         """Load the Whisper model."""
         if self.model is None:
             try:
                 # Try to import from dedicated whisper venv
-                import sys
-
-                whisper_venv = os.path.expanduser("~/whisper-env")
-                if os.path.exists(whisper_venv):
-                    # Try different Python versions
-                    for py_ver in ["python3.14", "python3.13", "python3.12"]:
-                        site_packages = os.path.join(whisper_venv, "lib", py_ver, "site-packages")
-                        if os.path.exists(site_packages):
-                            sys.path.insert(0, site_packages)
-                            break
-
-                import whisper
+                site_packages = self._find_whisper_site_packages()
+                if site_packages and site_packages not in sys.path:
+                    sys.path.insert(0, site_packages)
 
                 print(f"🎤 Loading Whisper model: {self.model_name}")
-                self.model = whisper.load_model(self.model_name)
+                self.model = self._load_faster_whisper() or self._load_openai_whisper()
                 print("✅ Whisper model loaded")
             except ImportError as e:
-                raise ImportError(f"openai-whisper not installed. Run: pip install openai-whisper. Error: {e}")
+                raise ImportError(
+                    f"Whisper not installed. Run: pip install faster-whisper (or openai-whisper). Error: {e}"
+                )
+
+    @classmethod
+    def _find_whisper_site_packages(cls) -> str:
+        if cls._whisper_site_packages is None:
+            cls._whisper_site_packages = ""
+            whisper_venv = os.path.expanduser("~/whisper-env")
+            if os.path.exists(whisper_venv):
+                # Try different Python versions
+                for py_ver in ["python3.14", "python3.13", "python3.12"]:
+                    site_packages = os.path.join(whisper_venv, "lib", py_ver, "site-packages")
+                    if os.path.exists(site_packages):
+                        cls._whisper_site_packages = site_packages
+                        break
+        return cls._whisper_site_packages
+
+    def _load_faster_whisper(self):
+        """CTranslate2 backend: int8 on CPU, float16 on GPU. None if not installed."""
+        try:
+            import ctranslate2
+            from faster_whisper import WhisperModel
+        except ImportError:
+            return None
+
+        if ctranslate2.get_cuda_device_count() > 0:
+            device, compute_type = "cuda", "float16"
+        else:
+            device, compute_type = "cpu", "int8"
+        self._faster = True
+        return WhisperModel(self.model_name, device=device, compute_type=compute_type)
+
+    def _load_openai_whisper(self):
+        import whisper
+
+        self._faster = False
+        return whisper.load_model(self.model_name)
+
+    def _transcribe(self, audio) -> str:
+        """Run the loaded model on a float32 array or an audio file path."""
+        if self._faster:
+            segments, _ = self.model.transcribe(audio, beam_size=1, **_DECODE_OPTIONS)
+            return "".join(s.text for s in segments).strip()
+        # openai-whisper decodes greedily at temperature 0 when beam_size/best_of are unset
+        return self.model.transcribe(audio, fp16=False, **_DECODE_OPTIONS)["text"].strip()
+
+    def transcribe_audio(
+        self, audio_data: Union[bytes, bytearray, memoryview, np.ndarray], sample_rate: int = 16000
+    ) -> Optional[str]:
+        """Transcribe audio data to text.
+
+        audio_data is 16-bit mono PCM as any buffer (bytearray and memoryview
+        are read in place) or an int16 array, or a float array in [-1, 1].
+        """
+        import numpy as np
 
-    def transcribe_audio(self, audio_data: bytes, sample_rate: int = 16000) -> Optional[str]:
-        """Transcribe audio data to text."""
         self.load_model()
 
-        # Convert bytes to numpy array
-        audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+        if isinstance(audio_data, np.ndarray):
+            samples = audio_data.reshape(-1)
+            if samples.dtype.kind == "f":
+                samples = samples.astype(np.float32, copy=False)  # already Whisper's input format
+            elif samples.dtype != np.int16:
+                raise ValueError(f"Unsupported audio dtype: {samples.dtype}")
+        else:
+            samples = np.frombuffer(audio_data, dtype=np.int16)
+
+        # Only speech goes to Whisper, whose encoder cost grows with input length
+        samples = _trim_to_speech(samples, sample_rate)
+        if not len(samples):
+            return ""
+
+        if samples.dtype == np.float32:
+            audio_np = samples
+        else:
+            # Scale int16 PCM to float32 in one pass, into a buffer kept between calls
+            if self._fp32_buf is None or len(self._fp32_buf) < len(samples):
+                self._fp32_buf = np.empty(len(samples), dtype=np.float32)
+            audio_np = self._fp32_buf[: len(samples)]
+            np.multiply(samples, np.float32(1.0 / 32768.0), out=audio_np)
 
         # Transcribe
         try:
-            result = self.model.transcribe(audio_np, fp16=False)
-            return result["text"].strip()
+            return self._transcribe(audio_np)
         except Exception as e:
             print(f"❌ Whisper transcription failed: {e}")
             return None
@@ -63,8 +189,7 @@ class WhisperTranscriber:
         self.load_model()
 
         try:
-            result = self.model.transcribe(audio_file_path)
-            return result["text"].strip()
+            return self._transcribe(audio_file_path)
         except Exception as e:
             print(f"❌ Whisper file transcription failed: {e}")
             return None
@@ -136,18 +261,20 @@ def setup_channel_transcription():
 
 
 if __name__ == "__main__":
+    import numpy
+
     # Test Whisper transcription
     transcriber = WhisperTranscriber("tiny")
 
     # Create a simple test audio (silence)
-    test_audio = np.zeros(16000, dtype=np.float32)  # 1 second of silence
+    test_audio = numpy.zeros(16000, dtype=numpy.float32)  # 1 second of silence
 
     try:
         transcriber.load_model()
         print("✅ Whisper test: Model loaded successfully")
 
         # Test transcription (will be empty for silence)
-        result = transcriber.transcribe_audio(test_audio.tobytes())
+        result = transcriber.transcribe_audio(test_audio)
         print(f"Test transcription result: '{result}'")
 
     except Exception as e:
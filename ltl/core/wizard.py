@@ -3,14 +3,9 @@
 Provides OpenCode-style interactive configuration management.
 """
 
-import os
-import sys
-import json
 import getpass
 from typing import Optional, Dict, Any
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from ltl.core.config import load_config, save_config, get_config_path
 
 
@@ -103,6 +98,7 @@ class ConfigWizard:
 
     def __init__(self):
         self.config = load_config()
+        self._dirty = False  # apply_setting() changes not yet committed
 
     def run_full_setup(self):
         """Run complete setup wizard."""
@@ -268,6 +264,19 @@ class ConfigWizard:
 
     def configure_single_setting(self, path: str, value: Any):
         """Configure a single setting by path (e.g., 'providers.openrouter.api_key')."""
+        self.apply_setting(path, value)
+        self.commit()
+        print_success(format_setting(path, value))
+
+    def apply_setting(self, path: str, value: Any):
+        """Set a value by dotted path in self.config without saving.
+
+        Changes are written by commit(), or once on leaving a ``with`` block:
+
+            with ConfigWizard() as wizard:
+                wizard.apply_setting("backend", "ollama")
+                wizard.apply_setting("providers.ollama.text_model", "gemma3")
+        """
         keys = path.split(".")
         config = self.config
 
@@ -279,8 +288,25 @@ class ConfigWizard:
 
         # Set value
         config[keys[-1]] = value
+        self._dirty = True
+
+    def commit(self):
+        """Write pending changes to the config file."""
         save_config(self.config)
-        print_success(f"Set {path} = {value if not isinstance(value, str) or len(value) < 20 else '***'}")
+        self._dirty = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Settings applied inside the block are saved once, and only on success
+        if exc_type is None and self._dirty:
+            self.commit()
+
+
+def format_setting(path: str, value: Any) -> str:
+    """'Set path = value' for display, hiding long strings such as API keys."""
+    return f"Set {path} = {value if not isinstance(value, str) or len(value) < 20 else '***'}"
 
 
 def set_provider(provider: str, api_key: Optional[str] = None, **kwargs):
@@ -0,0 +1,85 @@
+"""Long-lived helper processes driven over a line protocol.
+
+Voice input and output need packages installed in separate venvs
+(~/whisper-env, .venv311), so they can't be imported into the ltl process.
+LineWorker starts ``python -m <module>`` from such a venv once, writes one
+request line at a time to its stdin and reads one reply line from its stdout,
+so models stay loaded between requests.
+"""
+
+import os
+import select
+import subprocess
+import threading
+from typing import Optional, Sequence
+
+# Directory containing the ltl package, so the child can import its own module
+_PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class LineWorker:
+    """Parent-side handle on a child process (started on first request)."""
+
+    module: str = ""  # module run with ``python -m``; set by subclasses
+
+    def __init__(self, python: str, cwd: Optional[str] = None, args: Sequence[str] = ()):
+        self.python = python
+        self.cwd = cwd
+        self.args = list(args)  # passed to the child after the module name
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def request(self, line: str, timeout: float) -> str:
+        """Send one line and return the child's reply line (without newline).
+
+        Raises RuntimeError if the child exits or doesn't answer within
+        timeout; the next request then starts a fresh child.
+        """
+        with self._lock:
+            proc = self._ensure_started()
+            try:
+                proc.stdin.write(line + "\n")
+                proc.stdin.flush()
+                ready, _, _ = select.select([proc.stdout], [], [], timeout)
+                reply = proc.stdout.readline() if ready else ""
+            except OSError:
+                reply = ""
+            if not reply:
+                self._stop()
+                raise RuntimeError(f"{self.module} worker stopped responding")
+        return reply.rstrip("\n")
+
+    def close(self) -> None:
+        """Stop the child process, if running."""
+        with self._lock:
+            self._stop()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join(p for p in (_PACKAGE_PARENT, env.get("PYTHONPATH")) if p)
+            # Python's own fds are non-inheritable (PEP 446), so there is
+            # nothing to close; skipping the close_fds scan also lets CPython
+            # use posix_spawn when no cwd is set
+            self._proc = subprocess.Popen(
+                [self.python, "-m", self.module, *self.args],
+                cwd=self.cwd,
+                env=env,
+                close_fds=False,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        return self._proc
+
+    def _stop(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()  # EOF ends the child's loop
+            proc.wait(timeout=2)
+        except Exception:
+            proc.kill()
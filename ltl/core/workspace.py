@@ -7,6 +7,19 @@ LTL_DIR = os.path.expanduser("~/.ltl")
 WORKSPACE_DIR = os.path.join(LTL_DIR, "workspace")
 
 
+_WORKSPACE_SUBDIRS = ("sessions", "memory", "skills", "cron")
+
+
+def _write_new(path: str, content: str) -> None:
+    """Write content to path unless the file already exists (one open, no separate exists check)."""
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
 def get_workspace_path():
     """Get the workspace path."""
     return WORKSPACE_DIR
@@ -19,12 +32,9 @@ def get_config_path():
 
 def create_workspace():
     """Create the workspace directory structure."""
-    # Create main directories
-    os.makedirs(WORKSPACE_DIR, exist_ok=True)
-    os.makedirs(os.path.join(WORKSPACE_DIR, "sessions"), exist_ok=True)
-    os.makedirs(os.path.join(WORKSPACE_DIR, "memory"), exist_ok=True)
-    os.makedirs(os.path.join(WORKSPACE_DIR, "skills"), exist_ok=True)
-    os.makedirs(os.path.join(WORKSPACE_DIR, "cron"), exist_ok=True)
+    # Create main directories (makedirs creates WORKSPACE_DIR on the way)
+    for subdir in _WORKSPACE_SUBDIRS:
+        os.makedirs(os.path.join(WORKSPACE_DIR, subdir), exist_ok=True)
 
     # Create template files
     create_template_files()
@@ -33,210 +43,23 @@ def create_workspace():
 
 
 def create_template_files():
-    """Create template markdown files in workspace."""
-
-    templates = {
-        "AGENTS.md": """# Agent Instructions
-
-You are a helpful AI assistant. Be concise, accurate, and friendly.
-
-## Guidelines
-
-- Always explain what you're doing before taking actions
-- Ask for clarification when request is ambiguous
-- Use tools to help accomplish tasks
-- Remember important information in your memory files
-- Be proactive and helpful
-- Learn from user feedback
-
-## Capabilities
-
-- Voice interaction (speech-to-text and text-to-speech)
-- Vision analysis (camera/image understanding)
-- Web search for current information
-- Task management and reminders
-- Memory storage and recall
-- Tool execution (time, location, etc.)
-""",
-        "SOUL.md": """# Soul
-
-I am LTL (Local Talking LLM), a privacy-first AI assistant.
-
-## Personality
-
-- Helpful and friendly
-- Concise and to the point
-- Curious and eager to learn
-- Honest and transparent
-- Privacy-conscious
-
-## Values
-
-- User privacy and data security
-- Transparency in actions
-- Accuracy over speed
-- Continuous improvement
-- Local-first operation
-
-## Mission
-
-To provide intelligent AI assistance while keeping all data local and private.
-""",
-        "USER.md": """# User
-
-Information about user goes here.
-
-## Preferences
-
-- Communication style: (casual/formal)
-- Timezone: (your timezone)
-- Language: (your preferred language)
-- Voice: (enabled/disabled)
-- Vision: (enabled/disabled)
-
-## Personal Information
-
-- Name: (optional)
-- Location: (optional)
-- Occupation: (optional)
-
-## Learning Goals
-
-- What the user wants to learn from AI
-- Preferred interaction style
-- Areas of interest
-
-## Important Notes
-
-- (Any important preferences or facts to remember)
-""",
-        "IDENTITY.md": """# Identity
-
-## Name
-LTL (Local Talking LLM) 🎙️
-
-## Description
-Privacy-first personal AI assistant with voice interaction, vision capabilities, and local data storage.
-
-## Version
-2.1.0
-
-## Purpose
-- Provide intelligent AI assistance with complete privacy
-- Support voice interaction for hands-free operation
-- Enable vision analysis for image understanding
-- Maintain local-only data storage (no cloud)
-- Run efficiently on consumer hardware (4GB VRAM)
-
-## Capabilities
-
-### Core
-- Voice recognition (Whisper)
-- Natural language understanding (Gemma3)
-- Text-to-speech (Piper)
-- Vision analysis (Moondream)
-
-### Tools
-- Web search (DuckDuckGo)
-- Memory storage and retrieval
-- Task management
-- Time and location
-- File operations
-
-### Integrations
-- Ollama (local LLM)
-- OpenRouter (cloud fallback)
-- Multiple chat channels (planned)
-
-## Philosophy
-
-- Privacy over convenience
-- Local over cloud
-- Open source and transparent
-- User control and ownership
-- Community-driven development
-
-## Goals
-
-- Provide fast, private AI assistance
-- Enable offline operation
-- Support multi-modal interaction
-- Maintain high quality responses
-- Run on consumer hardware
-
-## License
-MIT License - Free and open source
-
-## Repository
-https://github.com/aidgoc/LTL
-
-## Contact
-Issues: https://github.com/aidgoc/LTL/issues
-""",
-        "TOOLS.md": """# Available Tools
-
-## Core Tools
-
-### Memory
-- `save_memory(key, content)` - Store information
-- `get_memory(key)` - Retrieve information
-- `search_memories(query)` - Search stored memories
-- `list_memories()` - List all memories
-
-### Tasks
-- `create_task(title, description)` - Create a new task
-- `list_tasks()` - List all tasks
-- `complete_task(task_id)` - Mark task as complete
-
-### Time & Location
-- `get_time()` - Get current time
-- `get_location()` - Get current location
-
-### Web
-- `web_search(query)` - Search the web
-- `fetch_url(url)` - Fetch content from URL
-
-### System
-- `execute_command(cmd)` - Execute shell command
-- `read_file(path)` - Read file contents
-- `write_file(path, content)` - Write to file
-
-## Usage
-
-Tools are automatically invoked based on user intent.
-The orchestrator determines which tools to use for each request.
-""",
-    }
-
-    for filename, content in templates.items():
-        filepath = os.path.join(WORKSPACE_DIR, filename)
-        if not os.path.exists(filepath):
-            with open(filepath, "w") as f:
-                f.write(content)
-
-    # Create memory file
-    memory_path = os.path.join(WORKSPACE_DIR, "memory", "MEMORY.md")
-    if not os.path.exists(memory_path):
-        with open(memory_path, "w") as f:
-            f.write("""# Long-term Memory
-
-This file stores important information that should persist across sessions.
-
-## User Information
-
-(Important facts about user)
-
-## Preferences
-
-(User preferences learned over time)
-
-## Important Notes
-
-(Things to remember)
-
-## Configuration
-
-- Model preferences
-- Channel settings
-- Tools enabled
-""")
+    """Create template markdown files in workspace.
+
+    The templates ship as package data in ltl/core/_templates (read only
+    here, not on import); files already in the workspace are left alone.
+    """
+    from importlib.resources import files
+
+    _copy_templates(files("ltl.core._templates"), WORKSPACE_DIR)
+
+
+def _copy_templates(src, dest_dir: str) -> None:
+    for entry in src.iterdir():
+        if entry.name.startswith(("_", ".")):
+            continue  # __init__.py, __pycache__
+        if entry.is_dir():
+            subdir = os.path.join(dest_dir, entry.name)
+            os.makedirs(subdir, exist_ok=True)
+            _copy_templates(entry, subdir)
+        elif entry.name.endswith(".md"):
+            _write_new(os.path.join(dest_dir, entry.name), entry.read_text(encoding="utf-8"))
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
 from datetime import datetime, timezone
 
 from sqlalchemy import (
@@ -396,3 +397,21 @@ class DatabaseManager:
                 item.sync_status = "success"
                 item.synced_at = datetime.now(timezone.utc)
                 s.commit()
+
+
+# Shared instances, one per database file
+ASSISTANT_DB_PATH = "~/.local/share/talking-llm/assistant.db"
+_dbs: dict[str, DatabaseManager] = {}
+_dbs_lock = threading.Lock()
+
+
+def get_db(db_path: str = ASSISTANT_DB_PATH) -> DatabaseManager:
+    """Get or create the shared DatabaseManager for db_path (tables created once)."""
+    key = os.path.expanduser(db_path)
+    with _dbs_lock:
+        db = _dbs.get(key)
+        if db is None:
+            db = DatabaseManager(key)
+            db.init_db()
+            _dbs[key] = db
+    return db
@@ -267,10 +267,14 @@ class Orchestrator:
     def __init__(self, config: dict, console: Console | None = None):
         self.console = console or Console()
 
-    def classify_intent(self, user_text: str) -> dict:
-        """Classify user intent via keyword matching. Defaults to chat."""
+    def classify_intent(self, user_text: str, announce: bool = True) -> dict:
+        """Classify user intent via keyword matching. Defaults to chat.
+
+        Pass announce=False to skip echoing the result to the console.
+        """
         result = self._classify(user_text)
-        self.console.print(f"[dim]Intent: {result['intent']} ({result['reasoning']})[/dim]")
+        if announce:
+            self.console.print(f"[dim]Intent: {result['intent']} ({result['reasoning']})[/dim]")
         return result
 
     def _classify(self, text: str) -> dict:
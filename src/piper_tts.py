@@ -12,17 +12,36 @@ log = get_logger(__name__)
 _DEFAULT_VOICE = os.path.expanduser("~/.local/share/piper/en_US-lessac-medium.onnx")
 
 
+def _cuda_available() -> bool:
+    """True if onnxruntime (Piper's inference backend) can run on a CUDA GPU."""
+    try:
+        import onnxruntime
+
+        return "CUDAExecutionProvider" in onnxruntime.get_available_providers()
+    except Exception:
+        return False
+
+
 class PiperTTSService:
-    """Text-to-speech using Piper (CPU, ~60MB)."""
+    """Text-to-speech using Piper (~60MB).
+
+    Runs on the CPU, leaving the GPU's 4 GB to the Ollama model. use_cuda
+    (config tools.voice.tts_cuda) moves it to the GPU when onnxruntime-gpu is
+    installed.
+    """
 
-    def __init__(self, voice_path: str | None = None):
+    def __init__(self, voice_path: str | None = None, use_cuda: bool = False):
         path = os.path.expanduser(voice_path or _DEFAULT_VOICE)
         if not os.path.exists(path):
             raise FileNotFoundError(
                 f"Piper voice model not found: {path}\n"
                 f"Download from: https://github.com/rhasspy/piper/releases"
             )
-        self.voice = PiperVoice.load(path)
+        if use_cuda and not _cuda_available():
+            log.warning("tts_cuda is set but onnxruntime has no CUDA provider; using the CPU")
+            use_cuda = False
+        self.voice = PiperVoice.load(path, use_cuda=use_cuda)
+        log.info(f"Piper voice loaded on {'CUDA' if use_cuda else 'CPU'}")
         self.sample_rate = self.voice.config.sample_rate
 
     def synthesize(self, text: str, **kwargs) -> tuple[int, np.ndarray]:
@@ -6,6 +6,9 @@ history into a plain-string prompt prefix, and exposes get_response().
 """
 
 import os
+from typing import AsyncIterator
+
+import orjson
 from rlm import RLM
 from langchain_core.messages import BaseMessage, HumanMessage
 from src.logging_config import get_logger
@@ -26,12 +29,14 @@ class RLMClient:
             # Support both top-level "ollama" key (default.yaml) and "providers.ollama" (config.json)
             ollama_cfg = config.get("ollama") or config.get("providers", {}).get("ollama", {})
             base_url = ollama_cfg.get("base_url", "http://localhost:11434").rstrip("/") + "/v1"
+            api_key = "ollama"  # Ollama ignores the key
+            model_name = ollama_cfg.get("text_model", "gemma3")
             self._rlm = RLM(
                 backend="openai",
                 backend_kwargs={
-                    "api_key": "ollama",   # Ollama ignores the key
+                    "api_key": api_key,
                     "base_url": base_url,
-                    "model_name": ollama_cfg.get("text_model", "gemma3"),
+                    "model_name": model_name,
                     "timeout": 120.0,      # local models can be slow
                 },
                 max_depth=max_depth,
@@ -40,15 +45,23 @@ class RLMClient:
         else:  # openrouter
             # Support both top-level "openrouter" key and "providers.openrouter"
             or_cfg = config.get("openrouter") or config.get("providers", {}).get("openrouter", {})
+            base_url = or_cfg.get("api_base") or "https://openrouter.ai/api/v1"
+            api_key = os.environ.get("OPENROUTER_API_KEY", or_cfg.get("api_key", ""))
+            model_name = or_cfg.get("text_model", "meta-llama/llama-3.3-70b-instruct:free")
             self._rlm = RLM(
                 backend="openrouter",
                 backend_kwargs={
-                    "api_key": os.environ.get("OPENROUTER_API_KEY", or_cfg.get("api_key", "")),
-                    "model_name": or_cfg.get("text_model", "meta-llama/llama-3.3-70b-instruct:free"),
+                    "api_key": api_key,
+                    "model_name": model_name,
                 },
                 max_depth=max_depth,
                 custom_system_prompt=system_prompt,
             )
+        # Used by astream_response(), which talks to the same endpoint directly
+        self._chat_url = base_url.rstrip("/") + "/chat/completions"
+        self._headers = {"Authorization": f"Bearer {api_key}"}
+        self._model_name = model_name
+        self._system_prompt = system_prompt
         log.info("RLMClient ready (backend=%s, max_depth=%d)", backend, max_depth)
 
     def get_response(self, text: str, history: list[BaseMessage] | None = None) -> str:
@@ -58,6 +71,39 @@ class RLMClient:
             return result.strip()
         return result.response.strip()
 
+    async def astream_response(self, text: str, history: list[BaseMessage] | None = None) -> AsyncIterator[str]:
+        """Yield the reply in pieces as the model generates it.
+
+        Makes one streamed chat completion against the backend RLM uses,
+        without RLM's recursive sub-calls, so the first words arrive quickly.
+        """
+        import httpx
+
+        body = {
+            "model": self._model_name,
+            "messages": [
+                {"role": "system", "content": self._system_prompt},
+                {"role": "user", "content": self._build_prompt(text, history)},
+            ],
+            "stream": True,
+        }
+        async with httpx.AsyncClient(timeout=120.0) as client:
+            async with client.stream("POST", self._chat_url, json=body, headers=self._headers) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        choices = orjson.loads(data).get("choices") or [{}]
+                    except orjson.JSONDecodeError:
+                        continue
+                    delta = choices[0].get("delta", {}).get("content")
+                    if delta:
+                        yield delta
+
     @staticmethod
     def _build_prompt(text: str, history: list[BaseMessage] | None) -> str:
         if not history:
@@ -0,0 +1,61 @@
+"""Tests for ltl/core/asr_worker.py."""
+
+import sys
+
+import pytest
+
+from ltl.core.asr_worker import AsrWorker
+
+# Stand-ins for sounddevice and openai-whisper, put on the worker's PYTHONPATH
+_FAKE_SOUNDDEVICE = """
+import numpy as np
+
+default = type("Default", (), {"device": [0, 0]})()
+
+def query_devices(device, kind):
+    return {"default_samplerate": 16000}
+
+class InputStream:
+    def __init__(self, samplerate, channels, dtype, blocksize, callback):
+        self.callback = callback
+        self.blocksize = blocksize
+
+    def __enter__(self):
+        for _ in range(3):
+            self.callback(np.ones((self.blocksize, 1), np.float32), self.blocksize, None, None)
+        return self
+
+    def __exit__(self, *exc):
+        pass
+"""
+
+_FAKE_WHISPER = """
+import os
+
+class Model:
+    def transcribe(self, audio, fp16):
+        return {"text": f" {len(audio)} samples in pid {os.getpid()} "}
+
+def load_model(name):
+    return Model()
+"""
+
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    (tmp_path / "sounddevice.py").write_text(_FAKE_SOUNDDEVICE)
+    (tmp_path / "whisper.py").write_text(_FAKE_WHISPER)
+    (tmp_path / "faster_whisper.py").write_text("raise ImportError")
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    w = AsrWorker(sys.executable)
+    yield w
+    w.close()
+
+
+def test_one_process_transcribes_every_recording(worker):
+    worker.start_recording()
+    first = worker.finish()
+    worker.start_recording()
+    second = worker.finish()
+    assert first.startswith("4800 samples")
+    assert first == second
@@ -0,0 +1,117 @@
+"""Tests for ltl/core/bus.py message routing."""
+
+import asyncio
+import threading
+
+from ltl.core.bus import InboundMessage, MessageBus, OutboundMessage
+
+
+def _inbound(content="hi"):
+    return InboundMessage(
+        channel="telegram", sender_id="1", chat_id="42", content=content, session_key="telegram:42", timestamp=0
+    )
+
+
+def test_consume_returns_published_message():
+    bus = MessageBus()
+    bus.publish_inbound(_inbound("ping"))
+    msg = bus.consume_inbound(timeout=1)
+    assert msg.content == "ping"
+
+
+def test_consume_times_out_when_empty():
+    bus = MessageBus()
+    assert bus.consume_inbound(timeout=0.01) is None
+
+
+def test_stop_wakes_blocked_consumer():
+    bus = MessageBus()
+    bus.start()
+    result = {}
+
+    def consume():
+        result["msg"] = bus.consume_inbound()
+
+    t = threading.Thread(target=consume)
+    t.start()
+    bus.stop()
+    t.join(timeout=2)
+    assert not t.is_alive()
+    assert result["msg"] is None
+
+
+def test_aiter_inbound_yields_until_stopped():
+    bus = MessageBus()
+    bus.start()
+    bus.publish_inbound(_inbound("one"))
+    bus.publish_inbound(_inbound("two"))
+
+    async def collect():
+        seen = []
+        async for msg in bus.aiter_inbound():
+            seen.append(msg.content)
+            if len(seen) == 2:
+                bus.stop()
+        return seen
+
+    assert asyncio.run(asyncio.wait_for(collect(), timeout=2)) == ["one", "two"]
+
+
+def test_aiter_inbound_wakes_on_publish_from_another_thread():
+    bus = MessageBus()
+    bus.start()
+
+    async def collect():
+        threading.Timer(0.05, bus.publish_inbound, [_inbound("late")]).start()
+        async for msg in bus.aiter_inbound():
+            bus.stop()
+            return msg.content
+
+    assert asyncio.run(asyncio.wait_for(collect(), timeout=2)) == "late"
+
+
+def test_publish_outbound_batch_groups_by_channel():
+    bus = MessageBus()
+    bus.publish_outbound_batch([
+        OutboundMessage(channel="telegram", chat_id="1", content="a", timestamp=0),
+        OutboundMessage(channel="discord", chat_id="2", content="b", timestamp=0),
+        OutboundMessage(channel="telegram", chat_id="3", content="c", timestamp=0),
+    ])
+    telegram = bus.get_channel_queue("telegram")
+    assert [telegram.popleft().content for _ in range(2)] == ["a", "c"]
+    assert bus.get_channel_queue("discord").popleft().content == "b"
+
+
+def test_full_inbound_queue_drops_oldest():
+    bus = MessageBus(max_inbound=2)
+    for content in ("one", "two", "three"):
+        bus.publish_inbound(_inbound(content))
+    assert bus.pressure() == 1.0
+    assert [bus.consume_inbound(timeout=0.1).content for _ in range(2)] == ["two", "three"]
+    assert bus.pressure() == 0.0
+
+
+def test_outbound_is_handed_to_channel_handler():
+    bus = MessageBus()
+    delivered = threading.Event()
+    seen = []
+
+    def handler(msg):
+        seen.append(msg.content)
+        delivered.set()
+
+    bus.register_channel_handler("telegram", handler)
+    bus.start()
+    bus.publish_outbound(OutboundMessage(channel="telegram", chat_id="1", content="hi", timestamp=0))
+    assert delivered.wait(timeout=2)
+    bus.stop()
+    assert seen == ["hi"]
+    assert not bus.thread.is_alive()
+
+
+def test_metadata_defaults_to_shared_empty_mapping():
+    msg = _inbound()
+    assert msg.metadata is None
+    assert msg.get_metadata() == {}
+    assert msg.get_metadata() is _inbound().get_metadata()
+    assert not hasattr(msg, "__dict__")
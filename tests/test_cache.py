@@ -0,0 +1,38 @@
+"""Tests for ltl/core/cache.py."""
+
+from ltl.core.cache import TTLCache
+
+
+def test_get_returns_stored_value():
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.hits == 1
+
+
+def test_missing_key_returns_default():
+    cache = TTLCache()
+    assert cache.get("nope") is None
+    assert cache.get("nope", "x") == "x"
+    assert cache.misses == 2
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("ltl.core.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+    now[0] += 11
+    assert cache.get("a") is None
+    assert len(cache) == 0
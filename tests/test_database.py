@@ -137,3 +137,17 @@ def test_vector_store_integration():
     finally:
         os.remove(db_path)
         shutil.rmtree(vec_dir, ignore_errors=True)
+
+
+def test_get_db_returns_shared_instance():
+    from src.database import get_db
+
+    tmp = tempfile.mkdtemp(prefix="ltl_db_")
+    try:
+        path = os.path.join(tmp, "shared.db")
+        db = get_db(path)
+        assert get_db(path) is db
+        db.save_memory("k", "v")
+        assert get_db(path).get_memory("k")["value"] == "v"
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
@@ -0,0 +1,131 @@
+"""Tests for ltl/core/localai.py — HTTP is served by httpx.MockTransport."""
+
+import httpx
+import orjson
+import pytest
+
+from ltl.core import localai
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Route LocalAIProvider's client through handler instead of the network."""
+    monkeypatch.setattr(localai.time, "sleep", lambda s: None)
+    real_client = httpx.Client
+
+    def install(handler):
+        monkeypatch.setattr(
+            httpx, "Client", lambda **kw: real_client(**{**kw, "transport": httpx.MockTransport(handler)})
+        )
+
+    return install
+
+
+def test_post_json_retries_a_503_once(serve):
+    bodies = []
+
+    def handler(request):
+        bodies.append(orjson.loads(request.content))
+        if len(bodies) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "hi"}}]})
+
+    serve(handler)
+    provider = localai.LocalAIProvider()
+    reply = provider.chat_completion([{"role": "user", "content": "hello"}], model="m")
+    assert reply["choices"][0]["message"]["content"] == "hi"
+    assert len(bodies) == 2
+    assert bodies[0] == bodies[1]
+    assert bodies[1]["messages"] == [{"role": "user", "content": "hello"}]
+
+
+def test_post_json_gives_up_after_the_retries(serve):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(502)
+
+    serve(handler)
+    provider = localai.LocalAIProvider()
+    with pytest.raises(Exception, match="LocalAI request failed"):
+        provider.chat_completion([{"role": "user", "content": "hello"}])
+    assert len(calls) == localai._RETRIES + 1
+
+
+def test_chat_completion_stream_parses_server_sent_events(serve):
+    sse = (
+        ": keep-alive\n"
+        "\n"
+        'data: {"choices": [{"delta": {"role": "assistant"}}]}\n'
+        'data: {"choices": [{"delta": {"content": "Hel"}}]}\n'
+        "event: ping\n"
+        "data: {not json\n"
+        'data: {"choices": []}\n'
+        'data:{"choices": [{"delta": {"content": "lo"}}]}\n'
+        "data: [DONE]\n"
+        'data: {"choices": [{"delta": {"content": "after done"}}]}\n'
+    )
+    seen = {}
+
+    def handler(request):
+        seen["stream"] = orjson.loads(request.content)["stream"]
+        return httpx.Response(200, text=sse)
+
+    serve(handler)
+    provider = localai.LocalAIProvider()
+    assert list(provider.chat_completion_stream([{"role": "user", "content": "hi"}])) == ["Hel", "lo"]
+    assert seen["stream"] is True
+
+
+def test_chat_completion_stream_raises_on_http_error(serve):
+    serve(lambda request: httpx.Response(500))
+    provider = localai.LocalAIProvider()
+    with pytest.raises(Exception, match="LocalAI request failed"):
+        list(provider.chat_completion_stream([{"role": "user", "content": "hi"}]))
+
+
+@pytest.fixture
+def health(serve, monkeypatch):
+    """Count /health probes; the status they answer is settable."""
+    monkeypatch.setattr(localai, "_provider_cache", None)
+    probes = {"count": 0, "status": 200}
+
+    def handler(request):
+        probes["count"] += 1
+        return httpx.Response(probes["status"])
+
+    serve(handler)
+    return probes
+
+
+def _localai_config(base_url="http://localhost:8080"):
+    return {"providers": {"localai": {"enabled": True, "base_url": base_url}}}
+
+
+def test_cached_provider_is_reused_within_the_ttl(health):
+    provider = localai._get_cached_provider(_localai_config())
+    assert provider is not None
+    assert localai._get_cached_provider(_localai_config()) is provider
+    assert health["count"] == 1
+
+
+def test_unavailable_provider_is_cached_too(health, monkeypatch):
+    health["status"] = 503
+    assert localai._get_cached_provider(_localai_config()) is None
+    assert localai._get_cached_provider(_localai_config()) is None
+    assert health["count"] == 1
+
+    monkeypatch.setattr(localai, "_HEALTH_TTL", 0.0)
+    health["status"] = 200
+    assert localai._get_cached_provider(_localai_config()) is not None
+    assert health["count"] == 2
+
+
+def test_base_url_change_closes_the_old_client(health):
+    old = localai._get_cached_provider(_localai_config())
+    new = localai._get_cached_provider(_localai_config("http://localhost:9090/"))
+    assert new is not old
+    assert new.base_url == "http://localhost:9090"
+    assert old.client.is_closed
+    assert health["count"] == 2
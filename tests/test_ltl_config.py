@@ -0,0 +1,89 @@
+"""Tests for ltl/core/config.py loading and caching."""
+
+import json
+
+import pytest
+
+from ltl.core import config as ltl_config
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    monkeypatch.setattr(ltl_config, "CONFIG_PATH", str(path))
+    monkeypatch.setattr(ltl_config, "ENV_PATH", str(tmp_path / ".env"))
+    monkeypatch.setattr(ltl_config, "_cache", None)
+    monkeypatch.setattr(ltl_config, "_env_file_cache", None)
+    return path
+
+
+def test_load_config_returns_independent_copies(config_path):
+    config_path.write_text(json.dumps({"backend": "ollama"}))
+    first = ltl_config.load_config()
+    first["backend"] = "openrouter"
+    assert ltl_config.load_config()["backend"] == "ollama"
+
+
+def test_load_config_sees_file_changes(config_path):
+    ltl_config.save_config({"backend": "ollama"})
+    assert ltl_config.load_config()["backend"] == "ollama"
+    ltl_config.save_config({"backend": "openrouter"})
+    assert ltl_config.load_config()["backend"] == "openrouter"
+
+
+def test_env_file_overrides_api_keys(config_path, monkeypatch):
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    monkeypatch.delenv("TELEGRAM_BOT_TOKEN", raising=False)
+    config_path.write_text(json.dumps({"backend": "ollama"}))
+    (config_path.parent / ".env").write_text('# keys\nGROQ_API_KEY = "gsk-1"\nnot a line\nTELEGRAM_BOT_TOKEN=\'tok\'\n')
+    config = ltl_config.load_config()
+    assert config["providers"]["groq"]["api_key"] == "gsk-1"
+    assert config["channels"]["telegram"]["token"] == "tok"
+
+
+def test_load_raw_config_leaves_out_env_keys(config_path, monkeypatch):
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    assert ltl_config.load_raw_config() == ltl_config.get_default_config()
+    config_path.write_text(json.dumps({"backend": "ollama"}))
+    (config_path.parent / ".env").write_text("GROQ_API_KEY=gsk-1\n")
+    assert ltl_config.load_raw_config() == {"backend": "ollama"}
+
+
+def test_save_config_replaces_file_atomically(config_path):
+    ltl_config.save_config({"backend": "ollama"})
+    assert json.loads(config_path.read_text()) == {"backend": "ollama"}
+    assert config_path.stat().st_mode & 0o777 == 0o600
+    assert not (config_path.parent / "config.json.tmp").exists()
+
+
+def test_wizard_batches_settings_into_one_save(config_path, monkeypatch):
+    from ltl.core import wizard
+
+    ltl_config.save_config({"backend": "ollama"})
+    saves = []
+    monkeypatch.setattr(wizard, "save_config", lambda cfg: saves.append(dict(cfg)))
+    with wizard.ConfigWizard() as w:
+        w.apply_setting("backend", "openrouter")
+        w.apply_setting("providers.groq.api_key", "gsk-1")
+    assert len(saves) == 1
+    assert saves[0]["backend"] == "openrouter"
+    assert saves[0]["providers"]["groq"]["api_key"] == "gsk-1"
+
+
+def test_config_set_saves_several_pairs_once(config_path, monkeypatch):
+    import argparse
+
+    from ltl.commands import config_wizard
+    from ltl.core import wizard
+
+    ltl_config.save_config({"backend": "ollama"})
+    saves = []
+    monkeypatch.setattr(wizard, "save_config", lambda cfg: saves.append(dict(cfg)))
+    parser = argparse.ArgumentParser()
+    config_wizard.add_config_subparser(parser.add_subparsers())
+    args = parser.parse_args(["config", "set", "backend=openrouter", "providers.groq.api_key=gsk-1", "a.b=c=d"])
+    args.func(args)
+    assert len(saves) == 1
+    assert saves[0]["backend"] == "openrouter"
+    assert saves[0]["providers"]["groq"]["api_key"] == "gsk-1"
+    assert saves[0]["a"]["b"] == "c=d"
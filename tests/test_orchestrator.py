@@ -101,3 +101,9 @@ def test_chat_general_question():
 
 def test_chat_default():
     assert _classify("tell me a joke") == "chat"
+
+
+def test_classify_without_announce_is_silent(capsys):
+    orch = Orchestrator({})
+    assert orch.classify_intent("hello there", announce=False)["intent"] == "chat"
+    assert capsys.readouterr().out == ""
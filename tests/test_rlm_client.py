@@ -187,3 +187,37 @@ def test_get_response_strips_whitespace(MockRLM):
     MockRLM.return_value = _make_rlm_mock("\n  trimmed \n")
     client = RLMClient({"backend": "ollama", "ollama": {}})
     assert client.get_response("x") == "trimmed"
+
+
+# ---------------------------------------------------------------------------
+# astream_response
+# ---------------------------------------------------------------------------
+
+@patch("src.rlm_client.RLM")
+def test_astream_response_yields_deltas(MockRLM, monkeypatch):
+    import asyncio
+
+    import httpx
+
+    sse = (
+        'data: {"choices":[{"delta":{"content":"Hel"}}]}\n\n'
+        'data: {"choices":[{"delta":{"content":"lo"}}]}\n\n'
+        "data: [DONE]\n\n"
+    )
+    seen = {}
+
+    def handler(request):
+        seen["url"] = str(request.url)
+        return httpx.Response(200, text=sse)
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx, "AsyncClient", lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw)
+    )
+    client = RLMClient({"backend": "ollama", "ollama": {}})
+
+    async def collect():
+        return [delta async for delta in client.astream_response("hi")]
+
+    assert asyncio.run(collect()) == ["Hel", "lo"]
+    assert seen["url"] == "http://localhost:11434/v1/chat/completions"
@@ -0,0 +1,34 @@
+"""Tests for ltl/core/semantic_cache.py (embeddings stubbed with fixed vectors)."""
+
+import numpy as np
+
+from ltl.core.semantic_cache import SemanticCache
+
+_VECTORS = {
+    "hi": np.array([1.0, 0.0]),
+    "hello": np.array([0.96, 0.28]),
+    "weather": np.array([0.0, 1.0]),
+}
+
+
+class _FixedCache(SemanticCache):
+    def _encode(self, text):
+        return _VECTORS[text]
+
+
+def test_similar_prompt_hits():
+    cache = _FixedCache(threshold=0.9)
+    cache.insert(0, "hi", "Hello!")
+    assert cache.lookup(0, "hello") == "Hello!"
+    assert cache.lookup(0, "weather") is None
+
+
+def test_scopes_are_isolated():
+    cache = _FixedCache(threshold=0.9)
+    cache.insert(0, "hi", "Hello!")
+    assert cache.lookup(1, "hi") is None
+
+
+def test_disabled_by_default():
+    assert SemanticCache.from_config({}) is None
+    assert SemanticCache.from_config({"cache": {"semantic": {"enabled": True}}}) is not None
@@ -97,3 +97,10 @@ def test_parse_tool_json(tmp_db):
     # Direct JSON with params
     parsed = te._parse_tool_json('{"tool": "list_tasks", "params": {}}')
     assert parsed["tool"] == "list_tasks"
+
+
+def test_parse_tool_kwargs():
+    from ltl.commands.tool import parse_tool_kwargs
+
+    kwargs = parse_tool_kwargs(["query=python packaging", "n=3", "t=0.5", "safe=False", "stray", "1x=2"])
+    assert kwargs == {"query": "python packaging", "n": 3, "t": 0.5, "safe": False}
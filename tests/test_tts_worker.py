@@ -0,0 +1,68 @@
+"""Tests for ltl/core/tts_worker.py."""
+
+import sys
+
+import pytest
+
+from ltl.core.tts_worker import TTSWorker
+
+# Stand-ins for the repo's tts module and sounddevice, importable from the worker's cwd
+_FAKE_TTS = """
+import numpy as np
+
+class TextToSpeechService:
+    def __init__(self, use_cuda=False):
+        with open("device.txt", "w") as f:
+            f.write("cuda" if use_cuda else "cpu")
+
+    def long_form_synthesize(self, text):
+        if text == "boom":
+            raise ValueError("bad text")
+        with open("spoken.txt", "a") as f:
+            f.write(text + "\\n")
+        return 22050, np.zeros(4, dtype=np.float32)
+"""
+
+_FAKE_SOUNDDEVICE = """
+def play(audio, sample_rate):
+    pass
+
+def wait():
+    pass
+"""
+
+
+@pytest.fixture
+def worker(tmp_path):
+    (tmp_path / "tts.py").write_text(_FAKE_TTS)
+    (tmp_path / "sounddevice.py").write_text(_FAKE_SOUNDDEVICE)
+    w = TTSWorker(sys.executable, cwd=str(tmp_path))
+    yield w
+    w.close()
+
+
+def test_one_process_speaks_every_sentence(worker, tmp_path):
+    worker.speak("Hello there. How are you?")
+    pid = worker._proc.pid
+    worker.speak("Bye!")
+    assert worker._proc.pid == pid
+    assert (tmp_path / "spoken.txt").read_text().splitlines() == ["Hello there.", "How are you?", "Bye!"]
+
+
+def test_synthesis_error_is_raised_and_worker_survives(worker, tmp_path):
+    with pytest.raises(RuntimeError, match="bad text"):
+        worker.speak("boom")
+    worker.speak("still here")
+    assert (tmp_path / "spoken.txt").read_text() == "still here\n"
+
+
+def test_piper_stays_on_the_cpu_unless_asked(worker, tmp_path):
+    worker.speak("Hi.")
+    assert (tmp_path / "device.txt").read_text() == "cpu"
+
+    cuda = TTSWorker(sys.executable, cwd=str(tmp_path), use_cuda=True)
+    try:
+        cuda.speak("Hi.")
+    finally:
+        cuda.close()
+    assert (tmp_path / "device.txt").read_text() == "cuda"
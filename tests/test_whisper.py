@@ -0,0 +1,81 @@
+"""Tests for ltl/core/whisper.py speech trimming."""
+
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from ltl.core.whisper import WhisperTranscriber, _trim_to_speech
+
+_RATE = 16000
+_FRAME = _RATE * 30 // 1000  # samples per 30 ms VAD frame
+
+
+@pytest.fixture(autouse=True)
+def fake_webrtcvad(monkeypatch):
+    """A webrtcvad whose frames count as speech when any sample is loud."""
+
+    class Vad:
+        def __init__(self, mode):
+            pass
+
+        def is_speech(self, frame, sample_rate):
+            return bool(np.abs(np.frombuffer(frame, dtype=np.int16)).max() > 1000)
+
+    monkeypatch.setitem(sys.modules, "webrtcvad", types.SimpleNamespace(Vad=Vad))
+
+
+def _clip(n_frames, voiced):
+    pcm = np.zeros(n_frames * _FRAME, dtype=np.int16)
+    for i in voiced:
+        pcm[i * _FRAME : (i + 1) * _FRAME] = 5000
+    return pcm
+
+
+def test_short_clip_with_some_speech():
+    # Fewer frames than the padding window
+    out = _trim_to_speech(_clip(10, [4]), _RATE)
+    assert len(out) == 10 * _FRAME
+
+
+def test_all_voiced_is_returned_unchanged():
+    pcm = _clip(20, range(20))
+    assert _trim_to_speech(pcm, _RATE) is pcm
+
+
+def test_no_speech_gives_empty_audio():
+    assert len(_trim_to_speech(_clip(20, []), _RATE)) == 0
+
+
+def test_speech_in_the_middle_keeps_padding():
+    # 200 ms of padding is 6 frames on each side of frames 40..49
+    out = _trim_to_speech(_clip(100, range(40, 50)), _RATE)
+    assert len(out) == (10 + 2 * 6) * _FRAME
+    assert np.abs(out).max() == 5000
+
+
+@pytest.mark.parametrize(
+    "convert",
+    [
+        lambda pcm: pcm.tobytes(),
+        lambda pcm: bytearray(pcm.tobytes()),
+        lambda pcm: memoryview(pcm.tobytes()),
+        lambda pcm: pcm,
+        lambda pcm: pcm / 32768.0,
+    ],
+    ids=["bytes", "bytearray", "memoryview", "int16", "float"],
+)
+def test_transcribe_audio_accepts_buffers_and_arrays(convert):
+    class Model:
+        def transcribe(self, audio, **options):
+            seen.append(audio)
+            return {"text": " hi "}
+
+    seen = []
+    transcriber = WhisperTranscriber()
+    transcriber.model = Model()
+    pcm = _clip(20, range(20))
+    assert transcriber.transcribe_audio(convert(pcm)) == "hi"
+    assert seen[0].dtype == np.float32
+    assert np.allclose(seen[0], pcm / 32768.0)
@@ -13,8 +13,8 @@ log = get_logger(__name__)
 class TextToSpeechService:
     """TTS service backed by Piper with automatic resampling to device rate."""
 
-    def __init__(self, voice_path: str | None = None, **kwargs):
-        self._backend = PiperTTSService(voice_path)
+    def __init__(self, voice_path: str | None = None, use_cuda: bool = False, **kwargs):
+        self._backend = PiperTTSService(voice_path, use_cuda=use_cuda)
         self.sample_rate = self._backend.sample_rate
         self.target_sample_rate = self._get_device_sample_rate()
         log.info(f"TTS initialized with source rate: {self.sample_rate}Hz, target rate: {self.target_sample_rate}Hz")